@@ -5,23 +5,30 @@ Pipeline: Browser Audio (webm) → STT (Gemini) → Agent (ADK) → TTS (Gemini)
 
 import os
 import io
-import base64
+import re
 import asyncio
+import hashlib
+import inspect
 import tempfile
 import logging
 import time
+import uuid
 import wave
 from pathlib import Path
 from typing import Optional, Callable, Any
+from contextvars import ContextVar
 from dataclasses import dataclass, field
 from dotenv import load_dotenv, find_dotenv
 
 from google import genai
 from google.genai import types
 from google.adk import Agent, Runner
+from google.adk.events import Event
 from google.adk.sessions import InMemorySessionService
 from google.adk.planners import BuiltInPlanner
 
+from vision_cache import VisionCache, encode_for_vision, frame_phash, warm_up_phash
+
 # Load .env from repo root (find_dotenv walks up directory tree)
 load_dotenv(find_dotenv())
 
@@ -36,6 +43,7 @@ AGENT_MODEL = "gemini-3-flash-preview"  # Agent reasoning (latest)
 
 # Safety constants
 ULTRASONIC_STALE_THRESHOLD = 2.0
+SENSOR_REFRESH_WAIT = 0.2  # seconds for an ultrasonic reply to arrive
 SAFETY_DISTANCE_BLOCK = 15
 
 # Calibration constants (tune on real robot)
@@ -43,15 +51,68 @@ CM_PER_SECOND_AT_2000 = 50  # Approximate cm/sec at motor speed 2000
 DEGREES_PER_SECOND_AT_1500 = 90  # Approximate degrees/sec at turn speed 1500
 VISION_MODEL = "gemini-2.5-flash"  # For camera analysis
 
+# move_timed directions: (left speed, right speed, cm/sec, degrees/sec - positive is left)
+_DIR_TABLE: dict[str, tuple[int, int, Optional[float], Optional[float]]] = {
+    "forward": (2000, 2000, CM_PER_SECOND_AT_2000, None),
+    "backward": (-2000, -2000, CM_PER_SECOND_AT_2000, None),
+    "left": (-1500, 1500, None, DEGREES_PER_SECOND_AT_1500),
+    "right": (1500, -1500, None, -DEGREES_PER_SECOND_AT_1500),
+}
+
+# Plan cache - recurring commands replay the agent's previous tool sequence
+PLAN_CACHE_TTL = 300  # seconds
+PLAN_CACHE_SIZE = 128
+PLAN_CACHE_DISTANCE_BUCKET = 20  # cm - plans only reused within the same distance band
+PERCEPTION_TOOLS = ("sense", "scan_360")  # Calls after these depend on what was seen - never replayed
+
+# Speculation - tools safe to run before the agent asks for them (never motor tools)
+SPECULATIVE_TOOLS = ("sense",)
+
+# Command batching - rapid commands within the window share one agent run
+COMMAND_BATCH_WINDOW = 0.05  # seconds
+COMMAND_BATCH_MAX = 5
+
 # Thinking configuration - extended reasoning for complex robot decisions
 # Range: 0 (off) to 24576 (maximum). Default auto is 8192.
 THINKING_BUDGET = 17200  # 70% of max (24576) - good balance of reasoning vs latency
+THINKING_BUDGET_SIMPLE = 512  # Direct motor/LED/clamp commands
+THINKING_BUDGET_DEFAULT = 4096  # Everything that isn't clearly simple or exploratory
+
+# Conversation window - only the most recent turns are re-sent to the agent each run
+CONVERSATION_WINDOW_TURNS = 8  # user turns (each with its tool calls and reply)
+
+# Emergency stop - checked before every agent run (word boundaries skip e.g. "nonstop")
+_STOP_RE = re.compile(r"\b(?:stop|halt|freeze|emergency)\b", re.IGNORECASE)
+
+# Command complexity - picks the thinking budget per agent run
+_SIMPLE_COMMAND_RE = re.compile(
+    r"^(?:please\s+)?(?:stop|halt|freeze|(?:go|move|drive)\s+(?:forward|back|backward|ahead)|"
+    r"(?:turn|spin)\s+(?:left|right|around)|"
+    r"set\s+(?:the\s+)?(?:leds?|lights?)|(?:open|close)\s+(?:the\s+)?(?:clamp|gripper)|clamp)\b",
+    re.IGNORECASE,
+)
+_COMPLEX_COMMAND_RE = re.compile(r"\b(?:find|explore|look\s+for|search|navigate)\b", re.IGNORECASE)
 
 # TTS audio output format (raw PCM from Gemini)
 TTS_SAMPLE_RATE = 24000  # 24kHz
 TTS_CHANNELS = 1  # Mono
 TTS_SAMPLE_WIDTH = 2  # 16-bit
 
+# TTS cache - synthesized audio persisted on disk so repeat phrases skip Gemini
+TTS_CACHE_DIR = Path(os.environ.get("TTS_CACHE_DIR") or Path(tempfile.gettempdir()) / "robot_tts_cache")
+TTS_CACHE_MAX_ENTRIES = 1000
+
+
+def classify_budget(command: str) -> int:
+    """Pick a thinking budget for a command: exploratory > unknown > simple."""
+    command = command.strip()
+    # Checked first: "turn left and then find the exit" still needs the full budget
+    if _COMPLEX_COMMAND_RE.search(command):
+        return THINKING_BUDGET
+    if _SIMPLE_COMMAND_RE.match(command):
+        return THINKING_BUDGET_SIMPLE
+    return THINKING_BUDGET_DEFAULT
+
 
 def pcm_to_wav(pcm_data: bytes) -> bytes:
     """Convert raw PCM audio to WAV format for browser playback."""
@@ -64,6 +125,69 @@ def pcm_to_wav(pcm_data: bytes) -> bytes:
     return buffer.getvalue()
 
 
+def wav_to_pcm(wav_data: bytes) -> bytes:
+    """Extract the raw PCM frames from WAV audio (inverse of pcm_to_wav)."""
+    with wave.open(io.BytesIO(wav_data), 'rb') as wav_file:
+        return wav_file.readframes(wav_file.getnframes())
+
+
+def _tts_cache_path(text: str) -> Path:
+    key = hashlib.blake2b(f"{TTS_VOICE}:{text}".encode(), digest_size=16).hexdigest()
+    return TTS_CACHE_DIR / f"{key}.wav"
+
+
+def tts_cache_get(text: str) -> Optional[bytes]:
+    """Return cached WAV bytes for text, or None on a miss."""
+    path = _tts_cache_path(text)
+    try:
+        audio = path.read_bytes()
+        os.utime(path)  # Bump mtime so eviction is least-recently-used
+        return audio
+    except OSError:
+        return None
+
+
+def tts_cache_put(text: str, audio: bytes):
+    """Store WAV bytes for text, evicting the least recently used entries."""
+    try:
+        TTS_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        _tts_cache_path(text).write_bytes(audio)
+
+        entries = list(TTS_CACHE_DIR.glob("*.wav"))
+        if len(entries) > TTS_CACHE_MAX_ENTRIES:
+            entries.sort(key=lambda p: p.stat().st_mtime)
+            for stale in entries[:len(entries) - TTS_CACHE_MAX_ENTRIES]:
+                stale.unlink(missing_ok=True)
+    except OSError as e:
+        logger.debug("TTS cache write failed: %s", e)
+
+
+def _store_tts_in_background(text: str, audio: bytes):
+    """Write a TTS cache entry from a worker thread without waiting for it."""
+    asyncio.get_running_loop().run_in_executor(None, tts_cache_put, text, audio)
+
+
+def _spec_args(args: dict) -> dict:
+    """Normalize tool args for speculation matching (omitted == None)."""
+    return {k: v for k, v in args.items() if v is not None}
+
+
+# Fast-path intents: unambiguous commands mapped straight to tool calls (skips the agent)
+# Each entry: (pattern over normalized text, match -> [(tool_name, kwargs), ...])
+_FAST_INTENTS = [
+    (re.compile(r"(?:go|move) (?:forward|ahead) (\d+) ?(?:cm|centimeters?)"),
+     lambda m: [("move_toward", {"distance_cm": int(m.group(1))})]),
+    (re.compile(r"turn (left|right)(?: (\d+) ?(?:degrees?|°))?"),
+     lambda m: [("turn_degrees", {"degrees": int(m.group(2) or 90) * (1 if m.group(1) == "left" else -1)})]),
+    (re.compile(r"(?:close|shut) (?:the )?(?:gripper|clamp)"),
+     lambda m: [("clamp_up", {})]),
+    (re.compile(r"open (?:the )?(?:gripper|clamp)"),
+     lambda m: [("clamp_down", {})]),
+    (re.compile(r"what do you see|look around"),
+     lambda m: [("sense", {})]),
+]
+
+
 # Robot brain prompt - perception-first with exploration
 ROBOT_BRAIN_INSTRUCTION = """You are the brain of a tank robot. PERCEIVE before you ACT.
 
@@ -76,6 +200,7 @@ ROBOT_BRAIN_INSTRUCTION = """You are the brain of a tank robot. PERCEIVE before
 ## PERCEPTION TOOLS
 - sense() → Returns: distance, gripper state, AND camera view description
 - sense("Is there a red ball?") → Same + answer to specific question
+- scan_360("Is there a red ball?") → Turns a full circle, answers for each 90° heading, ends facing the start
 
 ## MOVEMENT TOOLS
 - move_toward(cm) - Forward using ultrasonic feedback. Precise. Stops at distance.
@@ -91,10 +216,13 @@ ROBOT_BRAIN_INSTRUCTION = """You are the brain of a tank robot. PERCEIVE before
 ## EXPLORATION
 If asked to find something not currently visible:
 1. sense("Is there a [object]?")
-2. If not found: turn_degrees(90) + sense() - repeat up to 4 times (360° scan)
-3. If spotted: navigate toward it with move_toward() or move_timed()
+2. If not found: scan_360("Is there a [object]?")
+3. If spotted: turn_degrees() to that heading, then navigate with move_toward() or move_timed()
 4. Verify with sense() when close
 
+## MULTIPLE COMMANDS
+If given [COMMANDS] as a numbered list, carry them out in order and reply once.
+
 ## SAFETY
 - move_toward() auto-blocks if obstacle < 15cm
 - Emergency stop on "stop/halt/freeze/emergency"
@@ -107,7 +235,7 @@ If asked to find something not currently visible:
 ## EXAMPLES
 User: "go forward 30cm" → sense(), move_toward(30) → "Clear ahead. Moved 28cm, wall at 20cm."
 User: "look left" → turn_degrees(90), sense() → "Turned left. Chair 60cm ahead, clear path."
-User: "find the red ball" → sense("red ball?") → not found → turn_degrees(90), sense() → "Found! Ball 1m ahead." → move_toward(90) → "At the ball."
+User: "find the red ball" → sense("red ball?") → not found → scan_360("red ball?") → seen at 90° left → turn_degrees(90), sense("red ball?") → "Found! Ball 1m ahead." → move_toward(90) → "At the ball."
 User: "what do you see?" → sense() → "Distance 45cm. I see a wooden table with books, chair to the right."
 User: "pick up the cup" → sense("where is cup?"), move_toward(), clamp_down(), clamp_up(), sense("got it?") → "Cup secured."
 """
@@ -137,54 +265,115 @@ class AgentEvent:
         else:
             return f"{self.event_type.upper()}: {self.data}"
 
+    def to_dict(self) -> dict:
+        """JSON-ready form for streaming events to clients."""
+        return {"type": self.event_type, "data": self.data, "details": self.details}
+
+
+class EventBatcher:
+    """Coalesces AgentEvents emitted within one event-loop tick into one callback."""
+
+    def __init__(self, callback: Callable[[list[AgentEvent]], Any]):
+        self._callback = callback
+        self._pending: list[AgentEvent] = []
+        self._task: Optional[asyncio.Task] = None
+
+    def add(self, event: AgentEvent):
+        self._pending.append(event)
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._drain())
+
+    async def _drain(self):
+        await asyncio.sleep(0)  # Let the rest of this tick's events queue up
+        while self._pending:
+            batch, self._pending = self._pending, []
+            delivered = self._callback(batch)
+            if inspect.isawaitable(delivered):
+                await delivered
+            await asyncio.sleep(0)
+
+    async def flush(self):
+        """Deliver anything still queued."""
+        if self._task is not None:
+            await self._task
+        if self._pending:
+            await self._drain()
+
+
+class WindowedSessionService(InMemorySessionService):
+    """In-memory sessions that keep only the last few conversation turns.
+
+    Stored history is trimmed each time a user turn is appended, always at a user
+    turn boundary so tool calls are never separated from their responses. Each
+    read therefore copies (and hands the agent) a bounded history.
+    """
+
+    def __init__(self, max_turns: int = CONVERSATION_WINDOW_TURNS):
+        super().__init__()
+        self.max_turns = max_turns
+
+    async def append_event(self, session, event):
+        event = await super().append_event(session=session, event=event)
+        if event.author == "user":
+            stored = self.sessions.get(session.app_name, {}).get(session.user_id, {}).get(session.id)
+            if stored is not None:
+                user_turns = [i for i, stored_event in enumerate(stored.events) if stored_event.author == "user"]
+                if len(user_turns) > self.max_turns:
+                    del stored.events[:user_turns[-self.max_turns]]
+        return event
+
+
+# Session whose command is being processed - lets the shared tools find their robot
+_current_session: ContextVar["AISession"] = ContextVar("current_session")
+
 
 class AISession:
     """Manages AI voice control session for a robot."""
 
-    def __init__(self, robot_client):
+    # Shared by all sessions: one Gemini client and ADK agent/runner per process
+    client = None
+    agent = None
+    runner = None
+    session_service = None
+    _tools: dict[str, Callable[..., Any]] = {}
+    _speculative_tools: dict[str, Callable[..., Any]] = {}
+    _runners: dict[int, Runner] = {}
+    _shared_lock = asyncio.Lock()
+
+    def __init__(self, robot_client, local_plans: bool = True):
         self.robot = robot_client
-        self.client = None
-        self.agent = None
-        self.runner = None
-        self.session_service = None
         self.session_id = None
+        # False sends every command (except stop) through the agent - for the test harness
+        self.local_plans = local_plans
+        self._vision_cache = VisionCache()
+        # normalized command -> (tool sequence, stored_at, robot context)
+        self._plan_cache: dict[str, tuple[list[tuple[str, dict]], float, tuple]] = {}
+        # (previous tool, current tool) -> predicted next (tool, args), learned from cached plans
+        self._transitions: dict[tuple[Optional[str], str], tuple[str, dict]] = {}
+        self._speculation: Optional[tuple[tuple[str, dict], asyncio.Task]] = None
         self._initialized = False
+        self._init_lock = asyncio.Lock()
+        self._agent_lock = asyncio.Lock()  # ADK session handles one run at a time
+        self._pending_commands: list[tuple[str, Callable[[AgentEvent], None], asyncio.Future]] = []
+        self._flush_tasks: set[asyncio.Task] = set()
+        self._history_tasks: set[asyncio.Task] = set()
 
     async def _ensure_initialized(self):
-        """Lazy initialization of Gemini and ADK."""
-        if self._initialized:
-            return
+        """Lazy initialization of Gemini and ADK.
 
-        api_key = os.environ.get("GOOGLE_API_KEY") or os.environ.get("GEMINI_API_KEY")
-        if not api_key:
-            raise ValueError("GOOGLE_API_KEY or GEMINI_API_KEY not found in environment")
+        Callers check ``self._initialized`` first so the steady state never
+        awaits; the lock stops concurrent first requests from initializing twice.
+        """
+        async with self._init_lock:
+            if not self._initialized:
+                await self._do_init()
 
-        self.client = genai.Client(api_key=api_key)
+    async def _do_init(self):
+        """Create this session's ADK session (and the shared agent on first use)."""
+        async with AISession._shared_lock:
+            if AISession.runner is None:
+                AISession._init_shared()
 
-        # Create robot tools
-        tools = self._create_tools()
-
-        # Initialize ADK agent with maximum thinking for complex reasoning
-        self.agent = Agent(
-            model=AGENT_MODEL,
-            name="robot_brain",
-            instruction=ROBOT_BRAIN_INSTRUCTION,
-            tools=tools,
-            planner=BuiltInPlanner(
-                thinking_config=types.ThinkingConfig(
-                    include_thoughts=False,  # Don't include thinking in response text
-                    thinking_budget=THINKING_BUDGET
-                )
-            )
-        )
-        self.session_service = InMemorySessionService()
-        self.runner = Runner(
-            agent=self.agent,
-            app_name="robot_brain",
-            session_service=self.session_service
-        )
-
-        # Create session
         session = await self.session_service.create_session(
             app_name="robot_brain",
             user_id="user",
@@ -193,68 +382,145 @@ class AISession:
         self.session_id = session.id
         self._initialized = True
 
-    def _create_tools(self):
-        """Create robot control tools for the ADK agent."""
-        robot = self.robot
-        session = self  # Capture for vision API access
+    @classmethod
+    def _init_shared(cls):
+        """Create the Gemini client, tools, ADK agent and runner shared by all sessions."""
+        api_key = os.environ.get("GOOGLE_API_KEY") or os.environ.get("GEMINI_API_KEY")
+        if not api_key:
+            raise ValueError("GOOGLE_API_KEY or GEMINI_API_KEY not found in environment")
 
-        # === PERCEPTION ===
+        # Compile the vision-cache JIT kernel in the background while the agent loads
+        asyncio.get_running_loop().run_in_executor(None, warm_up_phash)
 
-        def sense(question: str = None) -> str:
-            """Get full environmental awareness: sensors + camera vision.
+        cls.client = genai.Client(api_key=api_key)
 
-            Args:
-                question: Optional specific question about what's visible.
-                         If None, returns sensors + brief scene description.
+        # Create robot tools
+        tools = cls._create_tools()
+        cls._tools = {tool.__name__: tool for tool in tools}
 
-            Returns:
-                Combined sensor readings and vision analysis.
-            """
-            # Get sensor readings
-            distance = robot.sensors.ultrasonic
-            gripper = robot.sensors.gripper_status
+        cls.session_service = WindowedSessionService()
+        cls._runners = {}
+        cls.runner = cls._runner_for(THINKING_BUDGET)
+        cls.agent = cls.runner.agent
 
-            parts = []
-            if distance is not None:
-                parts.append(f"Distance: {distance:.1f}cm")
-            else:
-                parts.append("Distance: No reading")
-            if gripper:
-                parts.append(f"Gripper: {gripper}")
+    @classmethod
+    def _runner_for(cls, budget: int) -> Runner:
+        """Return the runner whose agent thinks with the given budget, creating it on first use.
 
-            # Get vision analysis
-            vision_result = ""
+        All runners share one session service and app name, so conversation
+        history carries over whichever budget a command is routed to.
+        """
+        runner = cls._runners.get(budget)
+        if runner is None:
+            agent = Agent(
+                model=AGENT_MODEL,
+                name="robot_brain",
+                instruction=ROBOT_BRAIN_INSTRUCTION,
+                tools=list(cls._tools.values()),
+                planner=BuiltInPlanner(
+                    thinking_config=types.ThinkingConfig(
+                        include_thoughts=False,  # Don't include thinking in response text
+                        thinking_budget=budget
+                    )
+                )
+            )
+            runner = Runner(
+                agent=agent,
+                app_name="robot_brain",
+                session_service=cls.session_service
+            )
+            cls._runners[budget] = runner
+        return runner
+
+    @classmethod
+    def _create_tools(cls):
+        """Create robot control tools for the ADK agent.
+
+        The tools are shared by every AISession; each call resolves the calling
+        session (and its robot) through the _current_session context variable.
+        They are built once per process - later calls (e.g. a retried init)
+        return the existing functions.
+        """
+        if cls._tools:
+            return list(cls._tools.values())
+
+        # === PERCEPTION ===
+
+        async def describe_view(session: "AISession", question: str = None) -> str:
+            """Vision answer for the current camera view (the frame is grabbed before the first await)."""
+            robot = session.robot
             try:
                 # Check if robot has camera frame capability
                 if hasattr(robot, 'get_camera_frame'):
                     frame = robot.get_camera_frame()
-                    if frame:
-                        # Real camera - use Gemini vision
-                        prompt = question or "Briefly describe what's visible ahead. Be concise."
-                        vision_response = session.client.models.generate_content(
-                            model=VISION_MODEL,
-                            contents=[
-                                prompt,
-                                types.Part.from_bytes(data=frame, mime_type="image/jpeg")
-                            ]
-                        )
-                        vision_result = vision_response.text.strip()
-                    else:
-                        vision_result = "Camera: No frame available"
+                    if not frame:
+                        return "Camera: No frame available"
+                    # Reuse the last answer if the scene and question are unchanged
+                    phash = await asyncio.to_thread(frame_phash, frame)
+                    cached = session._vision_cache.get(phash, question) if phash is not None else None
+                    if cached is not None:
+                        logger.debug("Vision cache hit (phash=%016x)", phash)
+                        return cached
+                    # Real camera - use Gemini vision
+                    logger.debug("Vision cache miss")
+                    prompt = question or "Briefly describe what's visible ahead. Be concise."
+                    image, mime_type = await asyncio.to_thread(encode_for_vision, frame)
+                    vision_response = await session.client.aio.models.generate_content(
+                        model=VISION_MODEL,
+                        contents=[
+                            prompt,
+                            types.Part.from_bytes(data=image, mime_type=mime_type)
+                        ]
+                    )
+                    vision_result = vision_response.text.strip()
+                    if phash is not None:
+                        session._vision_cache.put(phash, question, vision_result)
+                    return vision_result
                 elif hasattr(robot, 'get_mock_vision'):
                     # Mock robot - return simulated vision
-                    vision_result = robot.get_mock_vision(question)
+                    return robot.get_mock_vision(question)
                 else:
-                    vision_result = "Camera: Not available"
+                    return "Camera: Not available"
             except Exception as e:
-                vision_result = f"Vision error: {e}"
+                return f"Vision error: {e}"
+
+        async def observe(question: str = None) -> str:
+            """Read sensors and camera - the work behind sense()."""
+            session = _current_session.get()
+            robot = session.robot
+            # Get sensor readings
+            distance = robot.sensors.ultrasonic
+            gripper = robot.sensors.gripper_status
+            dist_str = f"{distance:.1f}cm" if distance is not None else "No reading"
+            gripper_str = f" | Gripper: {gripper}" if gripper else ""
+
+            # Get vision analysis
+            vision_result = await describe_view(session, question)
+
+            return f"Distance: {dist_str}{gripper_str} | Vision: {vision_result}"
+
+        async def sense(question: str = None) -> str:
+            """Get full environmental awareness: sensors + camera vision.
+
+            Args:
+                question: Optional specific question about what's visible.
+                         If None, returns sensors + brief scene description.
+
+            Returns:
+                Combined sensor readings and vision analysis.
+            """
+            session = _current_session.get()
+            speculative = session._take_speculation("sense", {"question": question})
+            if speculative is not None:
+                return await speculative
+            return await observe(question)
 
-            parts.append(f"Vision: {vision_result}")
-            return " | ".join(parts)
+        # Read-only tools that may run speculatively while the agent is thinking
+        cls._speculative_tools = {"sense": observe}
 
         # === MOVEMENT WITH FEEDBACK ===
 
-        def move_toward(distance_cm: int) -> str:
+        async def move_toward(distance_cm: int) -> str:
             """Move forward approximately distance_cm using ultrasonic feedback.
 
             Args:
@@ -263,6 +529,7 @@ class AISession:
             Returns:
                 Result with actual distance traveled.
             """
+            robot = _current_session.get().robot
             if not robot.connected:
                 return "ERROR: Robot not connected"
 
@@ -280,7 +547,7 @@ class AISession:
             # Mock robot: simulate movement immediately (no real sensors)
             if hasattr(robot, 'simulate_move_toward'):
                 robot.motor(2000, 2000)
-                time.sleep(0.1)  # Brief delay for realism
+                await asyncio.sleep(0.1)  # Brief delay for realism
                 robot.stop()
                 robot.simulate_move_toward(distance_cm)
                 new_distance = robot.sensors.ultrasonic
@@ -295,9 +562,9 @@ class AISession:
             poll_interval = 0.15
 
             while time.time() - start_time < timeout:
-                time.sleep(poll_interval)
+                await asyncio.sleep(poll_interval)
                 robot.request_ultrasonic()
-                time.sleep(0.05)  # Wait for response
+                await asyncio.sleep(0.05)  # Wait for response
 
                 current = robot.sensors.ultrasonic
                 if current is None:
@@ -321,7 +588,7 @@ class AISession:
             traveled = start_distance - current if current else distance_cm
             return f"TIMEOUT after {traveled:.0f}cm. Obstacle at {current:.1f}cm."
 
-        def move_timed(direction: str, duration_ms: int) -> str:
+        async def move_timed(direction: str, duration_ms: int) -> str:
             """Move in a direction for specified duration.
 
             Args:
@@ -331,10 +598,18 @@ class AISession:
             Returns:
                 Result with estimated distance traveled.
             """
+            robot = _current_session.get().robot
             if not robot.connected:
                 return "ERROR: Robot not connected"
 
-            direction = direction.lower()
+            entry = _DIR_TABLE.get(direction)
+            if entry is None:  # Only normalize case when the agent didn't send lowercase
+                direction = direction.casefold()
+                entry = _DIR_TABLE.get(direction)
+            if entry is None:
+                return f"ERROR: Unknown direction '{direction}'. Use: forward, backward, left, right"
+            left_speed, right_speed, cm_per_sec, degrees_per_sec = entry
+
             duration_ms = max(100, min(5000, duration_ms))  # Clamp 100ms-5s
             duration_sec = duration_ms / 1000
 
@@ -344,45 +619,25 @@ class AISession:
                 if distance is not None and distance < SAFETY_DISTANCE_BLOCK:
                     return f"BLOCKED: Obstacle at {distance:.1f}cm"
 
-            # Set motor speeds based on direction
-            speed = 2000
-            if direction == "forward":
-                robot.motor(speed, speed)
-                estimated_cm = duration_sec * CM_PER_SECOND_AT_2000
-            elif direction == "backward":
-                robot.motor(-speed, -speed)
-                estimated_cm = duration_sec * CM_PER_SECOND_AT_2000
-            elif direction == "left":
-                robot.motor(-1500, 1500)
-                estimated_cm = None  # Rotation, not linear
-            elif direction == "right":
-                robot.motor(1500, -1500)
-                estimated_cm = None
-            else:
-                return f"ERROR: Unknown direction '{direction}'. Use: forward, backward, left, right"
+            robot.motor(left_speed, right_speed)
+            estimated_cm = duration_sec * cm_per_sec if cm_per_sec else None  # None for rotation
 
             # Wait for duration
-            time.sleep(duration_sec)
+            await asyncio.sleep(duration_sec)
             robot.stop()
 
             # Update mock robot state if applicable
             if direction == "forward" and hasattr(robot, 'simulate_move_toward'):
                 robot.simulate_move_toward(estimated_cm)
-            elif hasattr(robot, 'simulate_turn'):
-                if direction == "left":
-                    # Estimate degrees from duration: ~90°/sec at speed 1500
-                    estimated_degrees = int(duration_sec * DEGREES_PER_SECOND_AT_1500)
-                    robot.simulate_turn(estimated_degrees)
-                elif direction == "right":
-                    estimated_degrees = int(duration_sec * DEGREES_PER_SECOND_AT_1500)
-                    robot.simulate_turn(-estimated_degrees)
+            elif degrees_per_sec and hasattr(robot, 'simulate_turn'):
+                robot.simulate_turn(int(duration_sec * degrees_per_sec))
 
             if estimated_cm:
                 return f"Moved {direction} for {duration_ms}ms (~{estimated_cm:.0f}cm)"
             else:
                 return f"Rotated {direction} for {duration_ms}ms"
 
-        def turn_degrees(degrees: int) -> str:
+        async def turn_degrees(degrees: int) -> str:
             """Rotate the robot body by approximately N degrees.
 
             Args:
@@ -391,6 +646,7 @@ class AISession:
             Returns:
                 Result with estimated rotation.
             """
+            robot = _current_session.get().robot
             if not robot.connected:
                 return "ERROR: Robot not connected"
 
@@ -411,7 +667,7 @@ class AISession:
                 direction = "right"
 
             # Wait for rotation
-            time.sleep(duration_sec)
+            await asyncio.sleep(duration_sec)
             robot.stop()
 
             # Update mock robot heading if applicable
@@ -420,8 +676,39 @@ class AISession:
 
             return f"Rotated {direction} ~{abs(degrees)}°"
 
+        async def scan_360(question: str = None) -> str:
+            """Look all the way around in four 90° steps, ending at the starting heading.
+
+            Each view is analyzed while the robot keeps turning, so a scan costs four
+            turns plus about one vision round-trip instead of four.
+
+            Args:
+                question: Optional question to ask about every view, e.g. "Is there a red ball?"
+
+            Returns:
+                What was seen at each heading (degrees to the left of the starting heading).
+            """
+            session = _current_session.get()
+            if not session.robot.connected:
+                return "ERROR: Robot not connected"
+
+            views = []
+            for heading in (0, 90, 180, 270):
+                if heading:
+                    await turn_degrees(90)
+                views.append(asyncio.create_task(describe_view(session, question)))
+                await asyncio.sleep(0)  # Let the view grab its frame before the next turn
+            await turn_degrees(90)  # Back to the starting heading
+
+            results = await asyncio.gather(*views)
+            return "\n".join(
+                f"{heading}° left: {result}" if heading else f"Ahead: {result}"
+                for heading, result in zip((0, 90, 180, 270), results)
+            )
+
         def stop() -> str:
             """Emergency stop all motors immediately."""
+            robot = _current_session.get().robot
             robot.stop()
             return "STOPPED"
 
@@ -429,6 +716,7 @@ class AISession:
 
         def set_servo(channel: int, angle: int) -> str:
             """Set camera servo angle. Channel 0=pan, 1=tilt. Angle 90-150."""
+            robot = _current_session.get().robot
             if not robot.connected:
                 return "ERROR: Robot not connected"
             channel = max(0, min(1, channel))
@@ -438,6 +726,7 @@ class AISession:
 
         def set_leds(r: int, g: int, b: int) -> str:
             """Set LED color (RGB 0-255)."""
+            robot = _current_session.get().robot
             if not robot.connected:
                 return "ERROR: Robot not connected"
             r, g, b = [max(0, min(255, c)) for c in (r, g, b)]
@@ -446,6 +735,7 @@ class AISession:
 
         def clamp_up() -> str:
             """Close the gripper (pinch/grab)."""
+            robot = _current_session.get().robot
             if not robot.connected:
                 return "ERROR: Robot not connected"
             robot.gripper(1)
@@ -453,26 +743,303 @@ class AISession:
 
         def clamp_down() -> str:
             """Open the gripper (release)."""
+            robot = _current_session.get().robot
             if not robot.connected:
                 return "ERROR: Robot not connected"
             robot.gripper(2)
             return "Gripper opening"
 
         return [
-            sense, move_toward, move_timed, turn_degrees, stop,
+            sense, scan_360, move_toward, move_timed, turn_degrees, stop,
             set_servo, set_leds, clamp_up, clamp_down
         ]
 
-    async def process_audio(self, audio_base64: str) -> dict:
+    @staticmethod
+    def _normalize_command(text: str) -> str:
+        return text.lower().strip().rstrip(".!?")
+
+    def _plan_context(self) -> tuple:
+        """Robot state a cached plan depends on: (gripper, distance band)."""
+        distance = self.robot.sensors.ultrasonic
+        band = None if distance is None else int(distance // PLAN_CACHE_DISTANCE_BUCKET)
+        return (self.robot.sensors.gripper_status, band)
+
+    def _lookup_plan(self, normalized: str) -> Optional[list[tuple[str, dict]]]:
+        """Return the cached tool sequence for a command if still valid."""
+        entry = self._plan_cache.get(normalized)
+        if entry is None:
+            return None
+        plan, stored_at, context = entry
+        if time.monotonic() - stored_at > PLAN_CACHE_TTL or context != self._plan_context():
+            del self._plan_cache[normalized]
+            return None
+        return plan
+
+    @staticmethod
+    def _is_replayable(plan: list[tuple[str, dict]]) -> bool:
+        """True unless a tool call follows a perception call (its args came from what was seen)."""
+        for i, (name, _) in enumerate(plan):
+            if name in PERCEPTION_TOOLS:
+                return i == len(plan) - 1
+        return True
+
+    def _store_plan(self, normalized: str, plan: list[tuple[str, dict]], context: tuple):
+        if self._is_replayable(plan):
+            self._plan_cache.pop(normalized, None)
+            self._plan_cache[normalized] = (plan, time.monotonic(), context)
+            if len(self._plan_cache) > PLAN_CACHE_SIZE:
+                del self._plan_cache[next(iter(self._plan_cache))]
+
+        names = [None] + [name for name, _ in plan]
+        for i in range(len(plan) - 1):
+            self._transitions[(names[i], names[i + 1])] = plan[i + 1]
+
+    def _speculate(self, prev_tool: Optional[str], last_tool: str):
+        """Start the predicted next tool early if it is read-only."""
+        self._cancel_speculation()
+        predicted = self._transitions.get((prev_tool, last_tool))
+        if predicted is None or predicted[0] not in SPECULATIVE_TOOLS:
+            return
+        name, args = predicted
+        tool = self._speculative_tools.get(name)
+        if tool is None:
+            return
+        logger.debug("Speculating %s(%s)", name, args)
+        self._speculation = ((name, _spec_args(args)), asyncio.create_task(tool(**args)))
+
+    def _take_speculation(self, name: str, args: dict) -> Optional[asyncio.Task]:
+        """Hand over the speculative task if it matches this call, else discard it."""
+        if self._speculation is None:
+            return None
+        predicted, task = self._speculation
+        self._speculation = None
+        if predicted == (name, _spec_args(args)):
+            return task
+        task.cancel()
+        return None
+
+    def _cancel_speculation(self):
+        if self._speculation is not None:
+            self._speculation[1].cancel()
+            self._speculation = None
+
+    async def _run_local_plan(self, text: str, emit: Callable[[AgentEvent], None]) -> Optional[str]:
+        """Run a preset or cached tool sequence for a command, bypassing the agent.
+
+        Common commands match the _FAST_INTENTS table; recurring commands replay
+        the tool calls the agent made last time in the same robot context. The
+        turn is then added to the agent's history so follow-ups can refer to it.
+
+        Returns:
+            The last tool result as response text, or None if no local plan applies.
+        """
+        if not self.local_plans:
+            return None
+
+        normalized = self._normalize_command(text)
+        for pattern, build in _FAST_INTENTS:
+            match = pattern.fullmatch(normalized)
+            if match:
+                plan = build(match)
+                break
+        else:
+            plan = self._lookup_plan(normalized)
+            if plan is None:
+                return None
+            logger.debug("Plan cache hit: %s", normalized)
+
+        response = ""
+        calls: list[tuple[str, dict, Any]] = []
+        for name, args in plan:
+            emit(AgentEvent("tool_call", name, {"args": args}))
+            response = self._tools[name](**args)
+            if inspect.isawaitable(response):
+                response = await response
+            emit(AgentEvent("tool_result", name, {"result": response}))
+            calls.append((name, args, response))
+
+        # Record in the background so the reply isn't held up by a running agent
+        task = asyncio.create_task(self._record_local_turn(text, calls, response))
+        self._history_tasks.add(task)
+        task.add_done_callback(self._history_tasks.discard)
+        return response
+
+    async def _record_local_turn(self, text: str, calls: list[tuple[str, dict, Any]], response: str):
+        """Append a locally handled command to the ADK session as if the agent had run it."""
+        invocation_id = Event.new_id()
+
+        def event(author: str, role: str, part: types.Part) -> Event:
+            return Event(invocation_id=invocation_id, author=author,
+                         content=types.Content(role=role, parts=[part]))
+
+        events = [event("user", "user", types.Part.from_text(text=f"[COMMAND] {text}"))]
+        for name, args, result in calls:
+            call_id = f"adk-{uuid.uuid4()}"  # ADK strips adk- ids before they reach the model
+            events.append(event("robot_brain", "model", types.Part(
+                function_call=types.FunctionCall(id=call_id, name=name, args=args))))
+            events.append(event("robot_brain", "user", types.Part(
+                function_response=types.FunctionResponse(id=call_id, name=name, response={"result": result}))))
+        events.append(event("robot_brain", "model", types.Part.from_text(text=response)))
+
+        try:
+            async with self._agent_lock:
+                session = await self.session_service.get_session(
+                    app_name="robot_brain", user_id="user", session_id=self.session_id
+                )
+                for item in events:
+                    await self.session_service.append_event(session, item)
+        except Exception as e:
+            logger.warning("Could not record local command in agent history: %s", e)
+
+    async def _run_agent(self, command: str, emit: Callable[[AgentEvent], None]) -> str:
+        """Queue a command for the agent and wait for the response.
+
+        Commands arriving within COMMAND_BATCH_WINDOW of each other are merged
+        into one agent run, so a burst of N commands costs a single round-trip.
+        """
+        future = asyncio.get_running_loop().create_future()
+        self._pending_commands.append((command, emit, future))
+        if len(self._pending_commands) == 1:
+            self._schedule_flush()
+        return await future
+
+    def _schedule_flush(self):
+        task = asyncio.create_task(self._flush_commands())
+        self._flush_tasks.add(task)
+        task.add_done_callback(self._flush_tasks.discard)
+
+    async def _flush_commands(self):
+        """Run one agent invocation for the commands queued during the batch window."""
+        await asyncio.sleep(COMMAND_BATCH_WINDOW)
+        async with self._agent_lock:
+            batch = self._pending_commands[:COMMAND_BATCH_MAX]
+            del self._pending_commands[:COMMAND_BATCH_MAX]
+            if self._pending_commands:
+                self._schedule_flush()
+            if not batch:
+                return
+
+            def emit_all(event: AgentEvent):
+                for _, emit, _ in batch:
+                    emit(event)
+
+            try:
+                response = await self._invoke_agent([command for command, _, _ in batch], emit_all)
+            except Exception as e:
+                for _, _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+            else:
+                for _, _, future in batch:
+                    if not future.done():
+                        future.set_result(response)
+            finally:
+                self._cancel_speculation()
+
+    async def _invoke_agent(self, commands: list[str], emit: Callable[[AgentEvent], None]) -> str:
+        """Run the ADK agent once over one or more commands and return its reply."""
+        distance = self.robot.sensors.ultrasonic
+        clamp = self.robot.sensors.gripper_status
+        status = "Connected" if self.robot.connected else "DISCONNECTED"
+        dist_str = f"{distance:.1f}cm" if distance else "No reading"
+
+        clamp_str = f", Clamp: {clamp}" if clamp else ""
+        env = f"Robot: {status}, Distance: {dist_str}{clamp_str}"
+        if len(commands) == 1:
+            prompt = f"[ENV] {env}\n[COMMAND] {commands[0]}"
+        else:
+            numbered = "\n".join(f"{i}. {command}" for i, command in enumerate(commands, 1))
+            prompt = f"[ENV] {env}\n[COMMANDS]\n{numbered}"
+
+        emit(AgentEvent("env", env))
+        emit(AgentEvent("prompt", prompt))
+
+        context = self._plan_context()
+        tool_calls: list[tuple[str, dict]] = []
+        prev_tool: Optional[str] = None
+        response_text = ""
+
+        budget = max(classify_budget(command) for command in commands)
+        logger.debug("Thinking budget: %d", budget)
+
+        async for event in self._runner_for(budget).run_async(
+            user_id="user",
+            session_id=self.session_id,
+            new_message=types.Content(
+                role="user",
+                parts=[types.Part.from_text(text=prompt)]
+            )
+        ):
+            # Log raw event for debugging
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("ADK Event: %s", type(event).__name__)
+                if hasattr(event, 'author'):
+                    logger.debug("  Author: %s", event.author)
+
+            if event.content and event.content.parts:
+                for part in event.content.parts:
+                    # Handle function calls
+                    if hasattr(part, 'function_call') and part.function_call:
+                        fc = part.function_call
+                        # Extract args - handle different possible formats
+                        args = getattr(fc, 'args', None) or {}
+                        if not isinstance(args, dict):
+                            args = dict(args) if hasattr(args, 'keys') else {"raw": str(args)}
+
+                        tool_calls.append((fc.name, dict(args)))
+                        emit(AgentEvent("tool_call", fc.name, {"args": args}))
+
+                        # Drop a wrong guess now; a matching one is picked up by the tool itself
+                        if self._speculation is not None and self._speculation[0] != (fc.name, _spec_args(args)):
+                            self._cancel_speculation()
+
+                    # Handle function responses
+                    if hasattr(part, 'function_response') and part.function_response:
+                        fr = part.function_response
+                        # Extract result - handle different formats
+                        result_data = ""
+                        if hasattr(fr, 'response'):
+                            if isinstance(fr.response, dict):
+                                result_data = fr.response.get('result', str(fr.response))
+                            else:
+                                result_data = str(fr.response)
+                        emit(AgentEvent("tool_result", fr.name, {"result": result_data}))
+
+                        # Run the likely next read-only tool while the agent thinks
+                        self._speculate(prev_tool, fr.name)
+                        prev_tool = fr.name
+
+                    # Handle text responses
+                    if hasattr(part, 'text') and part.text:
+                        response_text += part.text
+
+        # Remember single-command plans for replay (perception-driven ones only feed speculation)
+        if len(commands) == 1 and tool_calls and all(name in self._tools for name, _ in tool_calls):
+            self._store_plan(self._normalize_command(commands[0]), tool_calls, context)
+
+        return response_text.strip() or "Done."
+
+    async def process_audio(
+        self,
+        audio_bytes: bytes,
+        on_audio_chunk: Optional[Callable[[bytes], Any]] = None,
+        on_event_batch: Optional[Callable[[list[AgentEvent]], Any]] = None
+    ) -> dict:
         """Process audio and return result with optional TTS audio.
 
         Args:
-            audio_base64: Base64-encoded webm audio from browser
+            audio_bytes: Raw webm audio from browser (binary WebSocket frame)
+            on_audio_chunk: Optional callback (sync or async) receiving TTS audio as
+                raw 16-bit PCM chunks while it is synthesized
+            on_event_batch: Optional callback (sync or async) receiving agent events
+                emitted within one event-loop tick as a list (delivered before TTS)
 
         Returns:
-            dict with keys: user_text, assistant_text, audio (base64 mp3)
+            dict with keys: user_text, assistant_text, audio (complete WAV bytes)
         """
-        await self._ensure_initialized()
+        _current_session.set(self)
+        if not self._initialized:
+            await self._ensure_initialized()
 
         result = {
             "user_text": None,
@@ -480,17 +1047,25 @@ class AISession:
             "audio": None
         }
 
-        # Decode audio
-        audio_bytes = base64.b64decode(audio_base64)
+        batcher = EventBatcher(on_event_batch) if on_event_batch else None
+        emit = batcher.add if batcher else (lambda event: None)
+
+        async def refresh_sensors():
+            """Ask for a fresh ultrasonic reading so the agent's ENV context is current."""
+            self.robot.request_ultrasonic()
+            await asyncio.sleep(SENSOR_REFRESH_WAIT)
 
-        # Step 1: STT - Transcribe audio
+        # Step 1: STT - Transcribe audio (overlapped with the sensor refresh)
         try:
-            stt_response = self.client.models.generate_content(
-                model=STT_MODEL,
-                contents=[
-                    "Transcribe this audio exactly. Return only the transcription.",
-                    types.Part.from_bytes(data=audio_bytes, mime_type="audio/webm")
-                ]
+            stt_response, _ = await asyncio.gather(
+                self.client.aio.models.generate_content(
+                    model=STT_MODEL,
+                    contents=[
+                        "Transcribe this audio exactly. Return only the transcription.",
+                        types.Part.from_bytes(data=audio_bytes, mime_type="audio/webm")
+                    ]
+                ),
+                refresh_sensors()
             )
             user_text = stt_response.text.strip()
             if not user_text:
@@ -498,56 +1073,36 @@ class AISession:
 
             result["user_text"] = user_text
         except Exception as e:
-            print(f"STT error: {e}")
+            logger.error("STT error: %s", e)
             return result
 
         # Emergency stop fast-path
-        if any(w in user_text.lower() for w in ("stop", "halt", "freeze", "emergency")):
+        if _STOP_RE.search(user_text):
             self.robot.stop()
             result["assistant_text"] = "Emergency stop executed."
-            result["audio"] = await self._generate_tts("Emergency stop executed.")
+            result["audio"] = await self._generate_tts("Emergency stop executed.", on_audio_chunk)
             return result
 
-        # Step 2: Process with ADK agent
+        # Step 2: Run a local plan for common/recurring commands (no agent
+        # round-trip), otherwise process with ADK agent
         try:
-            # Build environment context
-            distance = self.robot.sensors.ultrasonic
-            clamp = self.robot.sensors.gripper_status
-            status = "Connected" if self.robot.connected else "DISCONNECTED"
-            dist_str = f"{distance:.1f}cm" if distance else "No reading"
-
-            env = f"Robot: {status}, Distance: {dist_str}"
-            if clamp:
-                env += f", Clamp: {clamp}"
-
-            prompt = f"[ENV] {env}\n[COMMAND] {user_text}"
-
-            # Run agent
-            response_text = ""
-            async for event in self.runner.run_async(
-                user_id="user",
-                session_id=self.session_id,
-                new_message=types.Content(
-                    role="user",
-                    parts=[types.Part.from_text(text=prompt)]
-                )
-            ):
-                if event.content and event.content.parts:
-                    for part in event.content.parts:
-                        if hasattr(part, 'text') and part.text:
-                            response_text += part.text
-
-            result["assistant_text"] = response_text or "Done."
+            response = await self._run_local_plan(user_text, emit)
+            if response is None:
+                response = await self._run_agent(user_text, emit)
+            result["assistant_text"] = response
 
         except asyncio.TimeoutError:
             result["assistant_text"] = "Timeout - please try again."
         except Exception as e:
-            print(f"Agent error: {e}")
+            logger.exception("Agent error: %s", e)
             result["assistant_text"] = f"Error: {e}"
 
+        if batcher:
+            await batcher.flush()
+
         # Step 3: TTS
         if result["assistant_text"]:
-            result["audio"] = await self._generate_tts(result["assistant_text"])
+            result["audio"] = await self._generate_tts(result["assistant_text"], on_audio_chunk)
 
         return result
 
@@ -555,7 +1110,9 @@ class AISession:
         self,
         text: str,
         generate_tts: bool = False,
-        on_event: Optional[Callable[[AgentEvent], None]] = None
+        on_event: Optional[Callable[[AgentEvent], None]] = None,
+        on_event_batch: Optional[Callable[[list[AgentEvent]], Any]] = None,
+        on_audio_chunk: Optional[Callable[[bytes], Any]] = None
     ) -> dict:
         """Process text command directly (bypasses STT).
 
@@ -563,19 +1120,28 @@ class AISession:
             text: User command as text string
             generate_tts: Whether to generate TTS audio response
             on_event: Optional callback for real-time event logging
+            on_event_batch: Optional callback (sync or async) receiving all events
+                emitted within one event-loop tick as a list
+            on_audio_chunk: Optional callback (sync or async) receiving TTS audio as
+                raw 16-bit PCM chunks while it is synthesized (requires generate_tts)
 
         Returns:
             dict with keys: user_text, assistant_text, audio, events (list of AgentEvent)
         """
-        await self._ensure_initialized()
+        _current_session.set(self)
+        if not self._initialized:
+            await self._ensure_initialized()
 
         events: list[AgentEvent] = []
+        batcher = EventBatcher(on_event_batch) if on_event_batch else None
 
         def emit(event: AgentEvent):
             events.append(event)
-            logger.debug(str(event))
+            logger.debug("%s", event)
             if on_event:
                 on_event(event)
+            if batcher:
+                batcher.add(event)
 
         result = {
             "user_text": text,
@@ -584,114 +1150,89 @@ class AISession:
             "events": events
         }
 
-        # Emergency stop fast-path
-        if any(w in text.lower() for w in ("stop", "halt", "freeze", "emergency")):
-            emit(AgentEvent("tool_call", "stop", {"args": {}}))
-            self.robot.stop()
-            emit(AgentEvent("tool_result", "stop", {"result": "STOPPED"}))
-            result["assistant_text"] = "Emergency stop executed."
-            emit(AgentEvent("response", result["assistant_text"]))
-            if generate_tts:
-                result["audio"] = await self._generate_tts("Emergency stop executed.")
-            return result
-
-        # Process with ADK agent
         try:
-            distance = self.robot.sensors.ultrasonic
-            clamp = self.robot.sensors.gripper_status
-            status = "Connected" if self.robot.connected else "DISCONNECTED"
-            dist_str = f"{distance:.1f}cm" if distance else "No reading"
-
-            env = f"Robot: {status}, Distance: {dist_str}"
-            if clamp:
-                env += f", Clamp: {clamp}"
-
-            prompt = f"[ENV] {env}\n[COMMAND] {text}"
+            # Emergency stop fast-path
+            if _STOP_RE.search(text):
+                emit(AgentEvent("tool_call", "stop", {"args": {}}))
+                self.robot.stop()
+                emit(AgentEvent("tool_result", "stop", {"result": "STOPPED"}))
+                result["assistant_text"] = "Emergency stop executed."
+                emit(AgentEvent("response", result["assistant_text"]))
+                if generate_tts:
+                    result["audio"] = await self._generate_tts("Emergency stop executed.", on_audio_chunk)
+                return result
 
-            emit(AgentEvent("env", env))
-            emit(AgentEvent("prompt", prompt))
+            # Run a local plan for common/recurring commands (no agent
+            # round-trip), otherwise process with ADK agent
+            try:
+                response = await self._run_local_plan(text, emit)
+                if response is None:
+                    response = await self._run_agent(text, emit)
+                result["assistant_text"] = response
+                emit(AgentEvent("response", result["assistant_text"]))
+
+            except asyncio.TimeoutError:
+                result["assistant_text"] = "Timeout - please try again."
+                emit(AgentEvent("error", "Timeout"))
+            except Exception as e:
+                logger.exception("Agent error: %s", e)
+                result["assistant_text"] = f"Error: {e}"
+                emit(AgentEvent("error", str(e)))
 
-            response_text = ""
+            # Optional TTS
+            if generate_tts and result["assistant_text"]:
+                result["audio"] = await self._generate_tts(result["assistant_text"], on_audio_chunk)
 
-            async for event in self.runner.run_async(
-                user_id="user",
-                session_id=self.session_id,
-                new_message=types.Content(
-                    role="user",
-                    parts=[types.Part.from_text(text=prompt)]
+            return result
+        finally:
+            if batcher:
+                await batcher.flush()
+
+    def _tts_config(self) -> types.GenerateContentConfig:
+        return types.GenerateContentConfig(
+            response_modalities=["AUDIO"],
+            speech_config=types.SpeechConfig(
+                voice_config=types.VoiceConfig(
+                    prebuilt_voice_config=types.PrebuiltVoiceConfig(
+                        voice_name=TTS_VOICE
+                    )
                 )
-            ):
-                # Log raw event for debugging
-                logger.debug(f"ADK Event: {type(event).__name__}")
-                if hasattr(event, 'author'):
-                    logger.debug(f"  Author: {event.author}")
-
-                if event.content and event.content.parts:
-                    for part in event.content.parts:
-                        # Handle function calls
-                        if hasattr(part, 'function_call') and part.function_call:
-                            fc = part.function_call
-                            # Extract args - handle different possible formats
-                            args = {}
-                            if hasattr(fc, 'args') and fc.args:
-                                if isinstance(fc.args, dict):
-                                    args = fc.args
-                                elif hasattr(fc.args, 'items'):
-                                    args = dict(fc.args.items())
-                                else:
-                                    args = {"raw": str(fc.args)}
-
-                            emit(AgentEvent("tool_call", fc.name, {"args": args}))
-
-                        # Handle function responses
-                        if hasattr(part, 'function_response') and part.function_response:
-                            fr = part.function_response
-                            # Extract result - handle different formats
-                            result_data = ""
-                            if hasattr(fr, 'response'):
-                                if isinstance(fr.response, dict):
-                                    result_data = fr.response.get('result', str(fr.response))
-                                else:
-                                    result_data = str(fr.response)
-                            emit(AgentEvent("tool_result", fr.name, {"result": result_data}))
-
-                        # Handle text responses
-                        if hasattr(part, 'text') and part.text:
-                            response_text += part.text
-
-            result["assistant_text"] = response_text.strip() or "Done."
-            emit(AgentEvent("response", result["assistant_text"]))
+            )
+        )
 
-        except asyncio.TimeoutError:
-            result["assistant_text"] = "Timeout - please try again."
-            emit(AgentEvent("error", "Timeout"))
-        except Exception as e:
-            logger.exception(f"Agent error: {e}")
-            result["assistant_text"] = f"Error: {e}"
-            emit(AgentEvent("error", str(e)))
+    async def _generate_tts(
+        self,
+        text: str,
+        on_chunk: Optional[Callable[[bytes], Any]] = None
+    ) -> Optional[bytes]:
+        """Generate TTS audio and return it as WAV bytes (cached on disk).
 
-        # Optional TTS
-        if generate_tts and result["assistant_text"]:
-            result["audio"] = await self._generate_tts(result["assistant_text"])
+        Args:
+            text: Text to speak
+            on_chunk: Optional callback (sync or async) receiving raw 16-bit PCM
+                (TTS_SAMPLE_RATE, mono) as soon as Gemini streams it, so playback can
+                start before synthesis ends; every chunk holds whole samples
 
-        return result
+        Returns:
+            The complete WAV audio, or None on failure.
+        """
+        # Cache I/O (disk reads, LRU eviction scans) stays off the event loop
+        cached = await asyncio.to_thread(tts_cache_get, text)
+        if cached is not None:
+            if on_chunk:
+                delivered = on_chunk(wav_to_pcm(cached))
+                if inspect.isawaitable(delivered):
+                    await delivered
+            return cached
+
+        if on_chunk:
+            return await self._stream_tts(text, on_chunk)
 
-    async def _generate_tts(self, text: str) -> Optional[str]:
-        """Generate TTS audio and return as base64 string."""
         try:
-            tts_response = self.client.models.generate_content(
+            tts_response = await self.client.aio.models.generate_content(
                 model=TTS_MODEL,
                 contents=text,
-                config=types.GenerateContentConfig(
-                    response_modalities=["AUDIO"],
-                    speech_config=types.SpeechConfig(
-                        voice_config=types.VoiceConfig(
-                            prebuilt_voice_config=types.PrebuiltVoiceConfig(
-                                voice_name=TTS_VOICE
-                            )
-                        )
-                    )
-                )
+                config=self._tts_config()
             )
 
             if not tts_response.candidates:
@@ -706,10 +1247,52 @@ class AISession:
                     # TTS returns raw PCM - convert to WAV for browser playback
                     pcm_data = part.inline_data.data
                     wav_data = pcm_to_wav(pcm_data)
-                    return base64.b64encode(wav_data).decode()
+                    _store_tts_in_background(text, wav_data)
+                    return wav_data
+
+            return None
 
+        except Exception as e:
+            logger.error("TTS error: %s", e)
             return None
 
+    async def _stream_tts(self, text: str, on_chunk: Callable[[bytes], Any]) -> Optional[bytes]:
+        """Stream TTS audio, forwarding each PCM chunk the moment it arrives.
+
+        A chunk can end mid-sample; the odd trailing byte is held back and
+        prepended to the next chunk so the receiver always gets whole samples.
+        """
+        pcm_chunks: list[bytes] = []
+        carry = b""
+        try:
+            stream = await self.client.aio.models.generate_content_stream(
+                model=TTS_MODEL,
+                contents=text,
+                config=self._tts_config()
+            )
+            async for chunk in stream:
+                if not chunk.candidates:
+                    continue
+                content = chunk.candidates[0].content
+                if not content or not content.parts:
+                    continue
+                for part in content.parts:
+                    if getattr(part, 'inline_data', None) and part.inline_data.data:
+                        pcm_chunks.append(part.inline_data.data)
+                        pcm = carry + part.inline_data.data
+                        whole = len(pcm) - len(pcm) % TTS_SAMPLE_WIDTH
+                        carry = pcm[whole:]
+                        if not whole:
+                            continue
+                        delivered = on_chunk(pcm[:whole])
+                        if inspect.isawaitable(delivered):
+                            await delivered
         except Exception as e:
-            print(f"TTS error: {e}")
+            logger.error("TTS error: %s", e)
+            return None  # Don't cache a partial utterance
+
+        if not pcm_chunks:
             return None
+        wav_data = pcm_to_wav(b"".join(pcm_chunks))
+        _store_tts_in_background(text, wav_data)
+        return wav_data
@@ -6,79 +6,289 @@ REST endpoints for robot control + WebSocket for video/sensors/AI
 
 import asyncio
 import json
-from typing import Optional
+import os
+from typing import Annotated, AsyncIterator, Optional, Union
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI, WebSocket, WebSocketDisconnect, HTTPException
+from fastapi import FastAPI, WebSocket, WebSocketDisconnect, HTTPException, Depends
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
+from starlette.websockets import WebSocketState
+from pydantic import BaseModel, ConfigDict, Field
 
-from robot_client import robot
+from robot_client import RobotClient, get_robot
+
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import redis.asyncio as redis
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+
+try:
+    import uvloop  # noqa: F401 - only checked for availability; uvicorn installs it
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
+
+def dumps(data) -> str:
+    """Serialize a WebSocket JSON message (orjson when available)."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, default=str).decode()
+    return json.dumps(data, default=str)
+
+
+# /ws/sensors messages are MessagePack binary frames (JSON text frames without msgpack)
+_packer = msgpack.Packer(use_bin_type=True) if MSGPACK_AVAILABLE else None
+
+
+def pack_sensor(data: dict) -> Union[bytes, str]:
+    """Encode a /ws/sensors message."""
+    if _packer:
+        return _packer.pack(data)
+    return dumps(data)
+
+
+async def send_sensor(websocket: WebSocket, payload: Union[bytes, str]):
+    """Send a message encoded by pack_sensor()."""
+    if isinstance(payload, bytes):
+        await websocket.send_bytes(payload)
+    else:
+        await websocket.send_text(payload)
+
+
+# Constant control frames, encoded once
+_PING = pack_sensor({"type": "ping"})
+_AI_STATES = {
+    state: dumps({"type": "state", "state": state})
+    for state in ("idle", "listening", "thinking", "speaking")
+}
+
+
+robot: Optional[RobotClient] = None  # The robot this server drives, resolved in lifespan
 
 
 # === Pydantic Models ===
 
-class ConnectRequest(BaseModel):
+# Range checks run inside pydantic-core while the body is parsed
+MotorSpeed = Annotated[int, Field(ge=-4095, le=4095)]
+ColorChannel = Annotated[int, Field(ge=0, le=255)]
+
+
+class RobotRequest(BaseModel):
+    """Base for request bodies: immutable, unknown fields ignored."""
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
+
+class ConnectRequest(RobotRequest):
     ip: str
 
 
-class MotorRequest(BaseModel):
-    left: int
-    right: int
+class MotorRequest(RobotRequest):
+    left: MotorSpeed
+    right: MotorSpeed
 
 
-class ServoRequest(BaseModel):
+class ServoRequest(RobotRequest):
     channel: int
-    angle: int
+    angle: int  # Clamped to the servo's 90-150 range by RobotClient.servo
 
 
-class LEDRequest(BaseModel):
+class LEDRequest(RobotRequest):
     mode: int = 1
-    r: int = 255
-    g: int = 255
-    b: int = 255
+    r: ColorChannel = 255
+    g: ColorChannel = 255
+    b: ColorChannel = 255
     mask: int = 15
 
 
-class ModeRequest(BaseModel):
+class ModeRequest(RobotRequest):
     mode: int
 
 
-class GripperRequest(BaseModel):
+class GripperRequest(RobotRequest):
     action: int
 
 
 # === WebSocket Connection Manager ===
 
+SENSOR_COALESCE_WINDOW = 0.02  # seconds - updates within the window keep only the latest value per type
+VIDEO_CLIENT_QUEUE = 2  # frames buffered per video client; slow clients drop the oldest
+SENSOR_HEARTBEAT_INTERVAL = 30.0  # seconds between keep-alive pings on idle sensor sockets
+
+# Set to share sensor updates between uvicorn workers over Redis pub/sub
+REDIS_URL = os.environ.get("REDIS_URL")
+SENSOR_CHANNEL = "sensors"
+REDIS_RETRY_INITIAL = 1.0  # seconds before resubscribing after a Redis error (doubles per failure)
+REDIS_RETRY_MAX = 30.0
+
+
 class ConnectionManager:
     def __init__(self):
-        self.sensor_connections: list[WebSocket] = []
-        self.video_connections: list[WebSocket] = []
+        self.sensor_connections: set[WebSocket] = set()
+        self.video_connections: dict[WebSocket, asyncio.Queue[Optional[bytes]]] = {}
+        self._video_task: Optional[asyncio.Task] = None
+        self.video_start_lock = asyncio.Lock()
+        self._sensor_queue: asyncio.Queue[tuple[str, object]] = asyncio.Queue()
+        self.redis = None  # Set in lifespan when REDIS_URL is configured
+        self._redis_failing = False  # Publish errors are logged once per outage
+        self.heartbeat = asyncio.Event()  # Pulsed by run_heartbeat() for every sensor socket
 
     async def connect_sensors(self, websocket: WebSocket):
         await websocket.accept()
-        self.sensor_connections.append(websocket)
+        self.sensor_connections.add(websocket)
 
-    async def connect_video(self, websocket: WebSocket):
+    async def connect_video(self, websocket: WebSocket) -> asyncio.Queue[Optional[bytes]]:
+        """Accept a video client and return the queue its frames arrive on (None = stream ended)."""
         await websocket.accept()
-        self.video_connections.append(websocket)
+        queue: asyncio.Queue[Optional[bytes]] = asyncio.Queue(maxsize=VIDEO_CLIENT_QUEUE)
+        self.video_connections[websocket] = queue
+        return queue
 
     def disconnect_sensors(self, websocket: WebSocket):
-        if websocket in self.sensor_connections:
-            self.sensor_connections.remove(websocket)
+        self.sensor_connections.discard(websocket)
 
     def disconnect_video(self, websocket: WebSocket):
-        if websocket in self.video_connections:
-            self.video_connections.remove(websocket)
+        self.video_connections.pop(websocket, None)
+
+    @property
+    def video_running(self) -> bool:
+        return self._video_task is not None and not self._video_task.done()
+
+    def start_video(self, frames: AsyncIterator[bytes]):
+        """Fan frames from one source out to every video client's queue."""
+        self._video_task = asyncio.create_task(self._fan_out_video(frames))
+
+    def stop_video(self):
+        if self._video_task:
+            self._video_task.cancel()
+            self._video_task = None
+
+    def _offer_frame(self, queue: asyncio.Queue, frame: Optional[bytes]):
+        if queue.full():
+            queue.get_nowait()  # Drop the oldest frame rather than block the source
+        queue.put_nowait(frame)
+
+    async def _fan_out_video(self, frames: AsyncIterator[bytes]):
+        try:
+            async for frame in frames:
+                for queue in self.video_connections.values():
+                    self._offer_frame(queue, frame)
+        finally:
+            # Wake every client so it sees the end of the stream
+            for queue in self.video_connections.values():
+                self._offer_frame(queue, None)
 
     async def broadcast_sensor(self, data: dict):
-        """Broadcast sensor data to all connected clients."""
-        message = json.dumps(data)
-        for connection in self.sensor_connections[:]:
+        """Broadcast sensor data to all connected clients.
+
+        The message is encoded once and sent to every client concurrently, so a
+        slow client doesn't delay the others; failed clients are dropped afterwards.
+        """
+        # Drop clients that already disconnected instead of failing a send to them
+        dead = {c for c in self.sensor_connections if c.client_state != WebSocketState.CONNECTED}
+        self.sensor_connections -= dead
+        if not self.sensor_connections:
+            return
+        connections = tuple(self.sensor_connections)  # Stable order to match results
+        message = pack_sensor(data)
+        results = await asyncio.gather(
+            *(send_sensor(connection, message) for connection in connections),
+            return_exceptions=True
+        )
+        self.sensor_connections -= {
+            connection for connection, result in zip(connections, results)
+            if isinstance(result, BaseException)
+        }
+
+    def queue_sensor(self, sensor_type: str, value):
+        """Queue a sensor update for the drain loop (call on the event loop)."""
+        self._sensor_queue.put_nowait((sensor_type, value))
+
+    async def drain_sensors(self):
+        """Broadcast queued sensor updates, coalescing bursts so stale readings are skipped."""
+        while True:
+            sensor_type, value = await self._sensor_queue.get()
+            await asyncio.sleep(SENSOR_COALESCE_WINDOW)
+            latest = {sensor_type: value}
+            while not self._sensor_queue.empty():
+                sensor_type, value = self._sensor_queue.get_nowait()
+                latest[sensor_type] = value
+            for sensor_type, value in latest.items():
+                # This loop is the only path for sensor updates - one failure must not end it
+                try:
+                    await self.publish_sensor({
+                        "type": sensor_type,
+                        "value": value
+                    })
+                except Exception as e:
+                    print(f"Sensor broadcast error: {e}")
+
+    async def run_heartbeat(self):
+        """Wake every sensor socket to ping its client - one timer for all connections."""
+        while True:
+            await asyncio.sleep(SENSOR_HEARTBEAT_INTERVAL)
+            self.heartbeat.set()  # Releases the current waiters...
+            self.heartbeat.clear()  # ...and re-arms for the next interval
+
+    async def publish_sensor(self, data: dict):
+        """Send a sensor update to every worker's clients (just this worker's without Redis).
+
+        If Redis is unreachable the update still reaches this worker's clients.
+        """
+        if self.redis is not None:
             try:
-                await connection.send_text(message)
-            except:
-                self.sensor_connections.remove(connection)
+                await self.redis.publish(SENSOR_CHANNEL, dumps(data))
+                if self._redis_failing:
+                    print("Redis publish recovered")
+                    self._redis_failing = False
+                return
+            except Exception as e:
+                if not self._redis_failing:
+                    print(f"Redis publish failed ({e}) - broadcasting sensor updates locally")
+                    self._redis_failing = True
+        await self.broadcast_sensor(data)
+
+    async def relay_sensors(self):
+        """Fan sensor updates published by any worker out to this worker's clients.
+
+        Resubscribes with exponential backoff whenever the Redis connection fails.
+        """
+        delay = REDIS_RETRY_INITIAL
+        while True:
+            pubsub = self.redis.pubsub()
+            try:
+                await pubsub.subscribe(SENSOR_CHANNEL)
+                delay = REDIS_RETRY_INITIAL
+                async for message in pubsub.listen():
+                    if message["type"] != "message":
+                        continue
+                    try:
+                        data = json.loads(message["data"])
+                    except ValueError as e:
+                        print(f"Ignoring malformed sensor message: {e}")
+                        continue
+                    await self.broadcast_sensor(data)
+            except Exception as e:
+                print(f"Redis sensor relay failed ({e}) - resubscribing in {delay:.0f}s")
+            finally:
+                try:
+                    await pubsub.aclose()
+                except Exception:
+                    pass
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, REDIS_RETRY_MAX)
 
 
 manager = ConnectionManager()
@@ -92,30 +302,44 @@ _main_loop: Optional[asyncio.AbstractEventLoop] = None
 
 def on_sensor_update(sensor_type: str, value):
     """Called when robot sends sensor data (from recv_loop thread)."""
-    if _main_loop is None:
+    loop = _main_loop
+    if loop is None:
         return
 
-    # Schedule the coroutine on the main event loop from this thread
-    asyncio.run_coroutine_threadsafe(
-        manager.broadcast_sensor({
-            "type": sensor_type,
-            "value": value
-        }),
-        _main_loop
-    )
+    # Fire-and-forget hand-off to the drain loop on the main event loop
+    loop.call_soon_threadsafe(manager.queue_sensor, sensor_type, value)
 
 
 # === App Lifecycle ===
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    global _main_loop
-    # Startup: Capture event loop and register sensor callback
+    global _main_loop, robot
+    # Startup: Create the robot client, capture event loop and register sensor callback
+    robot = get_robot()
     _main_loop = asyncio.get_running_loop()
+    if hasattr(asyncio, "eager_task_factory"):
+        # Python 3.12+: tasks run inline until their first real await (saves a loop hop)
+        _main_loop.set_task_factory(asyncio.eager_task_factory)
+    tasks = [
+        asyncio.create_task(manager.drain_sensors()),
+        asyncio.create_task(manager.run_heartbeat()),
+    ]
+    if REDIS_URL and REDIS_AVAILABLE:
+        # Multi-worker: the worker driving the robot publishes, every worker relays
+        app.state.redis = manager.redis = redis.from_url(REDIS_URL)
+        tasks.append(asyncio.create_task(manager.relay_sensors()))
+    elif REDIS_URL:
+        print("REDIS_URL is set but the redis package is missing - sensor updates stay in-process")
     robot.add_sensor_callback(on_sensor_update)
     yield
     # Shutdown: Disconnect from robot
     _main_loop = None
+    for task in tasks:
+        task.cancel()
+    if manager.redis is not None:
+        await manager.redis.aclose()
+        manager.redis = None
     robot.disconnect()
 
 
@@ -140,6 +364,12 @@ app.add_middleware(
 
 # === REST Endpoints ===
 
+async def require_connected():
+    """Dependency for endpoints that need a live robot connection."""
+    if not robot.connected:
+        raise HTTPException(status_code=400, detail="Not connected to robot")
+
+
 @app.get("/api/status")
 async def get_status():
     """Get connection status."""
@@ -156,7 +386,8 @@ async def get_status():
 @app.post("/api/connect")
 async def connect(request: ConnectRequest):
     """Connect to robot."""
-    success = robot.connect(request.ip)
+    # TCP connect can block for up to its 5s timeout - keep it off the event loop
+    success = await asyncio.to_thread(robot.connect, request.ip)
     if not success:
         raise HTTPException(status_code=500, detail="Failed to connect to robot")
     return {"connected": True, "ip": request.ip}
@@ -165,79 +396,63 @@ async def connect(request: ConnectRequest):
 @app.post("/api/disconnect")
 async def disconnect():
     """Disconnect from robot."""
-    robot.disconnect()
+    await asyncio.to_thread(robot.disconnect)
     return {"connected": False}
 
 
-@app.post("/api/motor")
+@app.post("/api/motor", dependencies=[Depends(require_connected)])
 async def set_motor(request: MotorRequest):
     """Set motor speeds."""
-    if not robot.connected:
-        raise HTTPException(status_code=400, detail="Not connected to robot")
     robot.motor(request.left, request.right)
     return {"left": request.left, "right": request.right}
 
 
-@app.post("/api/stop")
+@app.post("/api/stop", dependencies=[Depends(require_connected)])
 async def stop_motors():
     """Stop all motors."""
-    if not robot.connected:
-        raise HTTPException(status_code=400, detail="Not connected to robot")
     robot.stop()
     return {"stopped": True}
 
 
-@app.post("/api/servo")
+@app.post("/api/servo", dependencies=[Depends(require_connected)])
 async def set_servo(request: ServoRequest):
     """Set servo angle."""
-    if not robot.connected:
-        raise HTTPException(status_code=400, detail="Not connected to robot")
     robot.servo(request.channel, request.angle)
     return {"channel": request.channel, "angle": request.angle}
 
 
-@app.post("/api/servo/home")
+@app.post("/api/servo/home", dependencies=[Depends(require_connected)])
 async def servo_home():
     """Reset servos to home position."""
-    if not robot.connected:
-        raise HTTPException(status_code=400, detail="Not connected to robot")
     robot.servo(0, 90)  # Pan center
     robot.servo(1, 140)  # Tilt up
     return {"pan": 90, "tilt": 140}
 
 
-@app.post("/api/led")
+@app.post("/api/led", dependencies=[Depends(require_connected)])
 async def set_led(request: LEDRequest):
     """Set LED color."""
-    if not robot.connected:
-        raise HTTPException(status_code=400, detail="Not connected to robot")
     robot.led(request.mode, request.r, request.g, request.b, request.mask)
     return request.model_dump()
 
 
-@app.post("/api/led/mode")
+@app.post("/api/led/mode", dependencies=[Depends(require_connected)])
 async def set_led_mode(request: ModeRequest):
     """Set LED animation mode."""
-    if not robot.connected:
-        raise HTTPException(status_code=400, detail="Not connected to robot")
     robot.led_mode(request.mode)
     return {"mode": request.mode}
 
 
-@app.post("/api/mode")
+@app.post("/api/mode", dependencies=[Depends(require_connected)])
 async def set_robot_mode(request: ModeRequest):
     """Set robot mode (0=free, 1=sonic, 2=line)."""
-    if not robot.connected:
-        raise HTTPException(status_code=400, detail="Not connected to robot")
     robot.set_mode(request.mode)
     return {"mode": request.mode}
 
 
-@app.post("/api/gripper")
+@app.post("/api/gripper", dependencies=[Depends(require_connected)])
 async def control_gripper(request: GripperRequest):
     """Control gripper (0=stop, 1=up, 2=down)."""
-    if not robot.connected:
-        raise HTTPException(status_code=400, detail="Not connected to robot")
     robot.gripper(request.action)
     return {"action": request.action}
 
@@ -251,17 +466,15 @@ async def shutdown_robot():
         robot.stop()
     # Execute shutdown command
     try:
-        subprocess.run(["sudo", "shutdown", "now"], check=False)
+        await asyncio.to_thread(subprocess.run, ["sudo", "shutdown", "now"], check=False)
         return {"shutdown": True}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Shutdown failed: {e}")
 
 
-@app.get("/api/ultrasonic")
+@app.get("/api/ultrasonic", dependencies=[Depends(require_connected)])
 async def get_ultrasonic():
     """Get ultrasonic distance (also triggers request)."""
-    if not robot.connected:
-        raise HTTPException(status_code=400, detail="Not connected to robot")
     robot.request_ultrasonic()
     return {"distance": robot.sensors.ultrasonic}
 
@@ -270,20 +483,30 @@ async def get_ultrasonic():
 
 @app.websocket("/ws/video")
 async def video_websocket(websocket: WebSocket):
-    """Stream video frames as binary WebSocket messages."""
-    await manager.connect_video(websocket)
-
-    if not robot.connected:
-        await websocket.close(code=1008, reason="Not connected to robot")
-        return
+    """Stream video frames as binary WebSocket messages.
 
-    # Start video if not already running
-    if not robot.start_video():
-        await websocket.close(code=1011, reason="Failed to start video stream")
-        return
+    All clients share one robot video stream; each gets its own small frame queue,
+    so a slow client skips frames instead of stalling the others.
+    """
+    queue = await manager.connect_video(websocket)
 
     try:
-        async for frame in robot.video_frames():
+        if not robot.connected:
+            await websocket.close(code=1008, reason="Not connected to robot")
+            return
+
+        # Start video if not already running
+        async with manager.video_start_lock:  # One video socket even if clients race
+            if not manager.video_running:
+                if not await asyncio.to_thread(robot.start_video):
+                    await websocket.close(code=1011, reason="Failed to start video stream")
+                    return
+                manager.start_video(robot.video_frames())
+
+        while True:
+            frame = await queue.get()
+            if frame is None:
+                break
             await websocket.send_bytes(frame)
     except WebSocketDisconnect:
         pass
@@ -293,41 +516,54 @@ async def video_websocket(websocket: WebSocket):
         manager.disconnect_video(websocket)
         # Only stop video if no other clients
         if not manager.video_connections:
+            manager.stop_video()
             robot.stop_video()
 
 
 @app.websocket("/ws/sensors")
 async def sensors_websocket(websocket: WebSocket):
-    """Stream sensor updates as JSON."""
+    """Stream sensor updates as MessagePack binary frames (JSON text if msgpack is missing).
+
+    Client messages (e.g. ultrasonic requests) are small JSON text frames.
+    """
     await manager.connect_sensors(websocket)
 
     try:
         # Send initial sensor state
-        await websocket.send_json({
+        await send_sensor(websocket, pack_sensor({
             "type": "initial",
             "ultrasonic": robot.sensors.ultrasonic,
             "gripper": robot.sensors.gripper_status,
             "connected": robot.connected
-        })
-
-        # Keep connection alive, receive any client messages
-        while True:
-            try:
-                # Wait for messages (like ultrasonic request)
-                # Use longer timeout (60s) to reduce unnecessary pings
-                data = await asyncio.wait_for(websocket.receive_text(), timeout=60.0)
-                msg = json.loads(data)
-
-                if msg.get("type") == "request_ultrasonic":
-                    robot.request_ultrasonic()
+        }))
 
-            except asyncio.TimeoutError:
-                # Send ping to keep connection alive
-                try:
-                    await websocket.send_json({"type": "ping"})
-                except Exception:
-                    # Connection lost, exit loop
-                    break
+        # Keep connection alive, receive any client messages. The receive and the
+        # shared heartbeat wait both stay pending across iterations, so there is no
+        # per-connection timer to arm for every message.
+        receive = asyncio.create_task(websocket.receive_text())
+        beat = asyncio.create_task(manager.heartbeat.wait())
+        try:
+            while True:
+                done, _ = await asyncio.wait({receive, beat}, return_when=asyncio.FIRST_COMPLETED)
+
+                if receive in done:
+                    msg = json.loads(receive.result())
+                    receive = asyncio.create_task(websocket.receive_text())
+
+                    if msg.get("type") == "request_ultrasonic":
+                        robot.request_ultrasonic()
+
+                if beat in done:
+                    beat = asyncio.create_task(manager.heartbeat.wait())
+                    # Send ping to keep connection alive
+                    try:
+                        await send_sensor(websocket, _PING)
+                    except Exception:
+                        # Connection lost, exit loop
+                        break
+        finally:
+            receive.cancel()
+            beat.cancel()
 
     except WebSocketDisconnect:
         pass
@@ -341,7 +577,10 @@ async def sensors_websocket(websocket: WebSocket):
 
 @app.websocket("/ws/ai")
 async def ai_websocket(websocket: WebSocket):
-    """AI voice control WebSocket."""
+    """AI voice control WebSocket.
+
+    Binary frames carry audio (webm in, raw 16-bit PCM TTS out); text frames carry JSON control messages.
+    """
     await websocket.accept()
 
     try:
@@ -350,58 +589,77 @@ async def ai_websocket(websocket: WebSocket):
             from ai_session import AISession
             session = AISession(robot)
         except ImportError as e:
-            await websocket.send_json({
+            await websocket.send_text(dumps({
                 "type": "error",
                 "message": f"AI mode not available: {e}"
-            })
+            }))
             await websocket.close()
             return
 
-        await websocket.send_json({"type": "state", "state": "idle"})
+        await websocket.send_text(_AI_STATES["idle"])
 
         while True:
-            data = await websocket.receive_json()
-
-            if data.get("type") == "start_listening":
-                await websocket.send_json({"type": "state", "state": "listening"})
-
-            elif data.get("type") == "audio":
-                await websocket.send_json({"type": "state", "state": "thinking"})
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                raise WebSocketDisconnect(message.get("code", 1000))
+
+            # Binary frame = recorded audio (webm) to process
+            if message.get("bytes") is not None:
+                await websocket.send_text(_AI_STATES["thinking"])
+
+                speaking = False
+
+                async def send_audio_chunk(chunk: bytes):
+                    # Stream TTS audio (raw PCM chunks) as binary frames while it is synthesized
+                    nonlocal speaking
+                    if not speaking:
+                        speaking = True
+                        await websocket.send_text(_AI_STATES["speaking"])
+                    await websocket.send_bytes(chunk)
+
+                async def send_events(events):
+                    # One frame per event-loop tick of agent activity (tool calls, results, ...)
+                    await websocket.send_text(dumps({
+                        "type": "agent_events",
+                        "events": [event.to_dict() for event in events]
+                    }))
 
                 # Process audio with AI
                 try:
-                    result = await session.process_audio(data["data"])
+                    result = await session.process_audio(
+                        message["bytes"],
+                        on_audio_chunk=send_audio_chunk,
+                        on_event_batch=send_events
+                    )
 
                     # Send transcript
                     if result.get("user_text"):
-                        await websocket.send_json({
+                        await websocket.send_text(dumps({
                             "type": "transcript",
                             "role": "user",
                             "text": result["user_text"]
-                        })
+                        }))
 
                     if result.get("assistant_text"):
-                        await websocket.send_json({
+                        await websocket.send_text(dumps({
                             "type": "transcript",
                             "role": "assistant",
                             "text": result["assistant_text"]
-                        })
-
-                    # Send TTS audio if available
-                    if result.get("audio"):
-                        await websocket.send_json({"type": "state", "state": "speaking"})
-                        await websocket.send_json({
-                            "type": "audio",
-                            "data": result["audio"]
-                        })
+                        }))
 
                 except Exception as e:
-                    await websocket.send_json({
+                    await websocket.send_text(dumps({
                         "type": "error",
                         "message": str(e)
-                    })
+                    }))
+
+                await websocket.send_text(_AI_STATES["idle"])
+                continue
 
-                await websocket.send_json({"type": "state", "state": "idle"})
+            data = json.loads(message["text"])
+
+            if data.get("type") == "start_listening":
+                await websocket.send_text(_AI_STATES["listening"])
 
     except WebSocketDisconnect:
         pass
@@ -413,4 +671,5 @@ async def ai_websocket(websocket: WebSocket):
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # libuv-backed loop for WebSocket-heavy traffic (falls back to stock asyncio)
+    uvicorn.run(app, host="0.0.0.0", port=8000, loop="uvloop" if UVLOOP_AVAILABLE else "asyncio")
@@ -4,9 +4,17 @@ Drop-in replacement for RobotClient that logs commands to console.
 Includes mock vision for testing perception-based navigation.
 """
 
+import sys
+from collections import deque
 from dataclasses import dataclass, field
 from typing import Optional
 
+COMMAND_LOG_SIZE = 10000  # Most recent commands kept by MockRobotClient
+
+
+# Bearing of each mock-object direction (degrees, counter-clockwise from the start heading)
+_DIR_ANGLE = {"ahead": 0, "left": 90, "right": 270, "behind": 180}
+
 
 @dataclass
 class SensorData:
@@ -14,13 +22,15 @@ class SensorData:
     gripper_status: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class MockObject:
     """An object in the mock environment."""
     name: str
     direction: str  # "ahead", "left", "right", "behind"
     distance_cm: float
     description: str = ""
+    angle: int = 0  # Bearing from _DIR_ANGLE, resolved when the object is added
+    name_lower: str = ""  # For case-insensitive matching against questions
 
 
 class MockRobotClient:
@@ -30,15 +40,23 @@ class MockRobotClient:
     navigation and object-finding capabilities.
     """
 
-    def __init__(self, ultrasonic: float = 50.0, gripper: str = "stopped"):
+    def __init__(self, ultrasonic: float = 50.0, gripper: str = "stopped", verbose: bool = True):
+        """
+        Args:
+            ultrasonic: Initial ultrasonic reading (cm)
+            gripper: Initial gripper status
+            verbose: Echo each command to the console (disable for stress tests)
+        """
         self._connected = True
+        self._verbose = verbose
         self._ip = "mock://test"
         self._sensors = SensorData(ultrasonic=ultrasonic, gripper_status=gripper)
-        self._command_log: list[str] = []
+        self._command_log: deque[str] = deque(maxlen=COMMAND_LOG_SIZE)
 
         # Mock vision state
         self._mock_scene = "A room with wooden floor and white walls."
         self._mock_objects: list[MockObject] = []
+        self._ahead_objects: list[MockObject] = []  # Subset that forward moves approach
         self._current_heading = 0  # 0=forward, 90=left, 180=behind, 270=right
 
     @property
@@ -67,11 +85,12 @@ class MockRobotClient:
 
     def _log(self, cmd: str):
         self._command_log.append(cmd)
-        print(f"  [MOCK] {cmd}")
+        if self._verbose:
+            sys.stdout.write(f"  [MOCK] {cmd}\n")  # Flushed by stdout's own buffering
 
     def get_command_log(self) -> list[str]:
-        """Get all commands sent during this session."""
-        return self._command_log.copy()
+        """Get the commands sent during this session (the most recent COMMAND_LOG_SIZE)."""
+        return list(self._command_log)
 
     def clear_log(self):
         """Clear command log."""
@@ -131,11 +150,18 @@ class MockRobotClient:
             distance_cm: How far away
             description: Optional extra description
         """
-        self._mock_objects.append(MockObject(name, direction, distance_cm, description))
+        obj = MockObject(
+            name, direction, distance_cm, description,
+            angle=_DIR_ANGLE.get(direction, 0), name_lower=name.lower()
+        )
+        self._mock_objects.append(obj)
+        if direction == "ahead":
+            self._ahead_objects.append(obj)
 
     def clear_mock_objects(self):
         """Remove all mock objects."""
         self._mock_objects.clear()
+        self._ahead_objects.clear()
 
     def get_mock_vision(self, question: str = None) -> str:
         """Simulate camera vision response.
@@ -146,15 +172,17 @@ class MockRobotClient:
         Returns:
             Simulated vision description.
         """
-        # Build description of visible objects (based on current heading)
+        question_lower = question.lower() if question else None
+        asked_about = None  # (object, visible) for the first object named in the question
+
+        # Build description of visible objects (based on current heading) in one pass
         visible_objects = []
         for obj in self._mock_objects:
-            # Calculate if object is visible from current heading
-            obj_angle = {"ahead": 0, "left": 90, "right": 270, "behind": 180}.get(obj.direction, 0)
-            relative_angle = (obj_angle - self._current_heading) % 360
+            relative_angle = (obj.angle - self._current_heading) % 360
 
             # Objects within ~60 degrees of forward are visible
-            if relative_angle <= 60 or relative_angle >= 300:
+            visible = relative_angle <= 60 or relative_angle >= 300
+            if visible:
                 if relative_angle <= 30 or relative_angle >= 330:
                     pos = "directly ahead"
                 elif relative_angle < 180:
@@ -163,21 +191,18 @@ class MockRobotClient:
                     pos = "slightly to the right"
                 visible_objects.append(f"{obj.name} {pos}, about {obj.distance_cm:.0f}cm away")
 
+            if question_lower and asked_about is None and obj.name_lower in question_lower:
+                asked_about = (obj, visible)
+
         # Handle specific questions
         if question:
-            question_lower = question.lower()
-
             # Check if asking about a specific object
-            for obj in self._mock_objects:
-                if obj.name.lower() in question_lower:
-                    # Check if visible
-                    obj_angle = {"ahead": 0, "left": 90, "right": 270, "behind": 180}.get(obj.direction, 0)
-                    relative_angle = (obj_angle - self._current_heading) % 360
-
-                    if relative_angle <= 60 or relative_angle >= 300:
-                        return f"Yes, I see the {obj.name} {obj.direction}, about {obj.distance_cm:.0f}cm away. {obj.description}"
-                    else:
-                        return f"I don't see the {obj.name} in my current view. It might be {obj.direction}."
+            if asked_about:
+                obj, visible = asked_about
+                if visible:
+                    return f"Yes, I see the {obj.name} {obj.direction}, about {obj.distance_cm:.0f}cm away. {obj.description}"
+                else:
+                    return f"I don't see the {obj.name} in my current view. It might be {obj.direction}."
 
             # Generic question response
             if visible_objects:
@@ -205,9 +230,8 @@ class MockRobotClient:
         Args:
             distance_cm: How far the robot moved forward.
         """
-        for obj in self._mock_objects:
-            if obj.direction == "ahead":
-                obj.distance_cm = max(0, obj.distance_cm - distance_cm)
+        for obj in self._ahead_objects:
+            obj.distance_cm = max(0, obj.distance_cm - distance_cm)
         # Also update ultrasonic
         if self._sensors.ultrasonic is not None:
             self._sensors.ultrasonic = max(0, self._sensors.ultrasonic - distance_cm)
@@ -9,9 +9,16 @@ import socket
 import struct
 import threading
 import asyncio
+from collections import deque
 from typing import Optional, Callable, AsyncGenerator
 from dataclasses import dataclass
 
+# Video frame length prefix (little-endian uint32), compiled once
+_LEN_STRUCT = struct.Struct('<L')
+
+CMD_RECV_SIZE = 4096  # bytes per command-channel recv - a page, so bursts of lines arrive in one call
+SEND_DRAIN_TIMEOUT = 1.0  # seconds disconnect() waits for queued commands to reach the socket
+
 
 @dataclass
 class SensorData:
@@ -25,17 +32,38 @@ class RobotClient:
     CMD_PORT = 5003
     VIDEO_PORT = 8003
 
+    _GRIPPER_STATUS = {"0": "stopped", "10": "up_complete", "20": "down_complete"}
+
+    # Command templates, formatted straight to bytes (no str format + encode per call)
+    _MOTOR_FMT = b'CMD_MOTOR#%d#%d\n'
+    _SERVO_FMT = b'CMD_SERVO#%d#%d\n'
+    _LED_FMT = b'CMD_LED#%d#%d#%d#%d#%d\n'
+    _LED_MOD_FMT = b'CMD_LED_MOD#%d\n'
+    _MODE_FMT = b'CMD_MODE#%d\n'
+    _ACTION_FMT = b'CMD_ACTION#%d\n'
+    _SONIC_CMD = b'CMD_SONIC#\n'
+
     def __init__(self):
         self._cmd_socket: Optional[socket.socket] = None
         self._video_socket: Optional[socket.socket] = None
+        self._video_writer: Optional[asyncio.StreamWriter] = None  # Owns the video socket while streaming
         self._connected = False
         self._video_running = False
         self._ip: Optional[str] = None
         self._recv_thread: Optional[threading.Thread] = None
+        self._send_thread: Optional[threading.Thread] = None
+        self._send_queue: deque[bytes] = deque()  # Unbounded - a dropped command could be a stop
+        self._send_event = threading.Event()
+        self._last_sent: dict[object, bytes] = {}  # Last servo/LED command per target, to skip repeats
+        self._last_sent_lock = threading.Lock()  # Commands are queued from several threads
         self._sensors = SensorData()
         self._sensor_callbacks: list[Callable[[str, any], None]] = []
-        self._lock = threading.Lock()
         self._latest_frame: Optional[bytes] = None  # Cache latest video frame
+        # Response command -> handler for its first parameter
+        self._handlers: dict[str, Callable[[str], None]] = {
+            "CMD_SONIC": self._handle_sonic,
+            "CMD_ACTION": self._handle_action,
+        }
 
     @property
     def connected(self) -> bool:
@@ -60,6 +88,8 @@ class RobotClient:
 
         try:
             self._cmd_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            # Commands are tiny and latency-critical (stop!) - don't let Nagle hold them back
+            self._cmd_socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
             self._cmd_socket.settimeout(5.0)
             self._cmd_socket.connect((ip, self.CMD_PORT))
             self._cmd_socket.settimeout(None)
@@ -70,6 +100,15 @@ class RobotClient:
             self._recv_thread = threading.Thread(target=self._recv_loop, daemon=True)
             self._recv_thread.start()
 
+            # Start writer thread so callers never block on socket I/O
+            self._send_queue.clear()
+            with self._last_sent_lock:
+                self._last_sent.clear()
+            self._send_thread = threading.Thread(
+                target=self._send_loop, args=(self._cmd_socket,), daemon=True
+            )
+            self._send_thread.start()
+
             print(f"Connected to robot at {ip}")
             return True
         except Exception as e:
@@ -78,9 +117,15 @@ class RobotClient:
             return False
 
     def disconnect(self):
-        """Disconnect from robot."""
+        """Disconnect from robot, first flushing any queued commands."""
         self._connected = False
         self._video_running = False
+        self._send_event.set()  # Wake writer thread so it drains the queue and exits
+
+        # Let the writer deliver what is still queued (e.g. a final stop) before the socket closes
+        if self._send_thread and self._send_thread is not threading.current_thread():
+            self._send_thread.join(timeout=SEND_DRAIN_TIMEOUT)
+        self._send_thread = None
 
         if self._cmd_socket:
             try:
@@ -90,44 +135,92 @@ class RobotClient:
                 pass
             self._cmd_socket = None
 
-        if self._video_socket:
-            try:
-                self._video_socket.shutdown(socket.SHUT_RDWR)
-                self._video_socket.close()
-            except:
-                pass
-            self._video_socket = None
+        self.stop_video()
 
         self._ip = None
         print("Disconnected from robot")
 
     def send_command(self, cmd: str):
-        """Send command to robot. Format: CMD_TYPE#param1#param2#...\n"""
+        """Queue command for the writer thread. Format: CMD_TYPE#param1#param2#...\n"""
         if not self._connected or not self._cmd_socket:
             return
 
         if not cmd.endswith('\n'):
             cmd += '\n'
 
-        with self._lock:
-            try:
-                self._cmd_socket.send(cmd.encode('utf-8'))
-            except Exception as e:
-                print(f"Error sending command: {e}")
+        with self._last_sent_lock:
+            self._last_sent.clear()  # Raw commands may change servo/LED state behind the cache
+        self._queue_command(cmd.encode('utf-8'))
+
+    def _queue_command(self, data: bytes, key: object = None):
+        """Queue an encoded, newline-terminated command for the writer thread.
+
+        With a key, the command is dropped if it repeats the last one queued for that key.
+        """
+        if not self._connected or not self._cmd_socket:
+            return
+
+        if key is not None:
+            with self._last_sent_lock:
+                if self._last_sent.get(key) == data:
+                    return
+                self._last_sent[key] = data
+
+        self._send_queue.append(data)
+        # The writer clears the event before draining, so while it is still set the
+        # writer is guaranteed to see this command; skip set() and its lock
+        if not self._send_event.is_set():
+            self._send_event.set()
+
+    def _send_loop(self, sock: socket.socket):
+        """Background thread draining the command queue onto the socket.
+
+        Exits after a final drain once disconnect() clears _connected. A failed
+        send disconnects, so callers see the lost link instead of queueing into
+        a writer that is gone.
+        """
+        while self._cmd_socket is sock:
+            self._send_event.wait()
+            self._send_event.clear()
+            # Read before draining: commands are only queued while connected, so
+            # once this is False the drain below picks up the last of them
+            closing = not self._connected
+            while self._send_queue and self._cmd_socket is sock:
+                # Coalesce everything queued so far (e.g. motor + servo + LED) into one send
+                batch = []
+                while self._send_queue:
+                    batch.append(self._send_queue.popleft())
+                try:
+                    sock.sendall(b''.join(batch))
+                except Exception as e:
+                    # Unless disconnect() or a reconnect already replaced this socket
+                    if self._connected and self._cmd_socket is sock:
+                        print(f"Error sending command: {e}")
+                        self.disconnect()  # connect() resets the queue and repeat filter
+                    return
+            if closing:
+                return
 
     def _recv_loop(self):
         """Background thread to receive sensor data."""
-        buffer = ""
+        buffer = bytearray()
+        chunk = bytearray(CMD_RECV_SIZE)
+        view = memoryview(chunk)
         while self._connected and self._cmd_socket:
             try:
-                data = self._cmd_socket.recv(1024).decode('utf-8')
-                if not data:
+                size = self._cmd_socket.recv_into(chunk)
+                if not size:
                     break
 
-                buffer += data
-                while '\n' in buffer:
-                    line, buffer = buffer.split('\n', 1)
+                # Decode all complete lines in one call (a partial UTF-8 sequence can
+                # only sit in the unterminated tail), then drop them in one memmove
+                buffer += view[:size]
+                end = buffer.rfind(b'\n')
+                if end < 0:
+                    continue
+                for line in buffer[:end].decode('utf-8').split('\n'):
                     self._parse_response(line.strip())
+                del buffer[:end + 1]
             except Exception as e:
                 if self._connected:
                     print(f"Receive error: {e}")
@@ -135,27 +228,25 @@ class RobotClient:
 
     def _parse_response(self, line: str):
         """Parse response from robot."""
-        if not line:
-            return
-
-        parts = line.split('#')
-        cmd = parts[0]
+        cmd, sep, params = line.partition('#')
+        handler = self._handlers.get(cmd)
+        if handler and sep:
+            handler(params.partition('#')[0])  # Only the first parameter is used
 
-        if cmd == "CMD_SONIC" and len(parts) > 1:
-            try:
-                distance = float(parts[1])
-                self._sensors.ultrasonic = distance
-                for cb in self._sensor_callbacks:
-                    cb("ultrasonic", distance)
-            except ValueError:
-                pass
+    def _handle_sonic(self, value: str):
+        try:
+            distance = float(value)
+        except ValueError:
+            return
+        self._sensors.ultrasonic = distance
+        for cb in self._sensor_callbacks:
+            cb("ultrasonic", distance)
 
-        elif cmd == "CMD_ACTION" and len(parts) > 1:
-            status_map = {"0": "stopped", "10": "up_complete", "20": "down_complete"}
-            status = status_map.get(parts[1], "unknown")
-            self._sensors.gripper_status = status
-            for cb in self._sensor_callbacks:
-                cb("gripper", status)
+    def _handle_action(self, value: str):
+        status = self._GRIPPER_STATUS.get(value, "unknown")
+        self._sensors.gripper_status = status
+        for cb in self._sensor_callbacks:
+            cb("gripper", status)
 
     # === Video Streaming ===
 
@@ -166,6 +257,7 @@ class RobotClient:
 
         try:
             self._video_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            self._video_socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
             self._video_socket.settimeout(5.0)
             self._video_socket.connect((self._ip, self.VIDEO_PORT))
             self._video_socket.settimeout(None)
@@ -177,12 +269,15 @@ class RobotClient:
             return False
 
     def stop_video(self):
-        """Stop video connection."""
+        """Stop video connection (safe to call from any thread)."""
         self._video_running = False
         if self._video_socket:
             try:
                 self._video_socket.shutdown(socket.SHUT_RDWR)
-                self._video_socket.close()
+                # While video_frames() streams, its transport owns the socket: the
+                # shutdown ends the stream and the transport closes it on the loop
+                if self._video_writer is None:
+                    self._video_socket.close()
             except:
                 pass
             self._video_socket = None
@@ -192,39 +287,19 @@ class RobotClient:
         if not self._video_socket:
             return
 
-        loop = asyncio.get_event_loop()
-
         try:
-            # Use makefile for easier reading
-            connection = self._video_socket.makefile('rb')
+            # Read on the event loop's own socket I/O - no thread-pool hop per frame
+            reader, self._video_writer = await asyncio.open_connection(sock=self._video_socket)
 
-            def read_frame():
-                """Blocking read of one frame - runs in thread pool."""
+            while self._video_running:
                 try:
-                    length_bytes = connection.read(4)
-                    if len(length_bytes) < 4:
-                        return None
-
-                    length = struct.unpack('<L', length_bytes)[0]
+                    length, = _LEN_STRUCT.unpack(await reader.readexactly(_LEN_STRUCT.size))
                     if length == 0 or length > 1_000_000:
-                        return b''  # Empty = skip this frame
-
-                    jpeg_data = connection.read(length)
-                    if len(jpeg_data) < length:
-                        return None
+                        continue  # Skip invalid frame
 
-                    return jpeg_data
-                except Exception:
-                    return None
-
-            while self._video_running:
-                # Run blocking read in thread pool to avoid blocking event loop
-                jpeg_data = await loop.run_in_executor(None, read_frame)
-
-                if jpeg_data is None:
-                    break
-                if jpeg_data == b'':
-                    continue  # Skip invalid frame
+                    jpeg_data = await reader.readexactly(length)
+                except (asyncio.IncompleteReadError, ConnectionError):
+                    break  # Stream closed
 
                 # Validate JPEG (basic check)
                 if self._is_valid_jpeg(jpeg_data):
@@ -236,6 +311,9 @@ class RobotClient:
             print(f"Video stream error: {e}")
         finally:
             self.stop_video()
+            if self._video_writer:
+                self._video_writer.close()
+                self._video_writer = None
 
     def _is_valid_jpeg(self, data: bytes) -> bool:
         """Basic JPEG validation."""
@@ -243,8 +321,11 @@ class RobotClient:
             return False
         # Check for JFIF or Exif marker
         if data[6:10] in (b'JFIF', b'Exif'):
-            # Check for JPEG end marker
-            return data.rstrip(b'\0\r\n').endswith(b'\xff\xd9')
+            # Check for JPEG end marker, skipping trailing padding without copying the frame
+            end = len(data)
+            while end and data[end - 1] in (0, 0x0d, 0x0a):
+                end -= 1
+            return data.endswith(b'\xff\xd9', 0, end)
         return True  # Allow other valid formats
 
     def get_camera_frame(self) -> Optional[bytes]:
@@ -259,42 +340,68 @@ class RobotClient:
 
     def motor(self, left: int, right: int):
         """Set motor speeds. Range: -4095 to 4095"""
-        left = max(-4095, min(4095, left))
-        right = max(-4095, min(4095, right))
-        self.send_command(f"CMD_MOTOR#{left}#{right}")
+        # Inline comparisons: cheaper than max(min()) at joystick rate
+        left = -4095 if left < -4095 else 4095 if left > 4095 else left
+        right = -4095 if right < -4095 else 4095 if right > 4095 else right
+        self._queue_command(self._MOTOR_FMT % (left, right))
 
     def stop(self):
         """Stop all motors."""
         self.motor(0, 0)
 
-    def servo(self, channel: int, angle: int):
-        """Set servo angle. Channel: 0=pan, 1=tilt. Angle: 90-150"""
-        angle = max(90, min(150, angle))
-        self.send_command(f"CMD_SERVO#{channel}#{angle}")
+    def servo(self, channel: int, angle: int, force: bool = False):
+        """Set servo angle. Channel: 0=pan, 1=tilt. Angle: 90-150
 
-    def led(self, mode: int, r: int, g: int, b: int, mask: int = 15):
-        """Set LED color. Mode: 0=off, 1=on, 2-5=animations. Mask: bitmask for LEDs 1-4"""
-        r = max(0, min(255, r))
-        g = max(0, min(255, g))
-        b = max(0, min(255, b))
-        self.send_command(f"CMD_LED#{mode}#{r}#{g}#{b}#{mask}")
+        Repeats of the last angle sent are skipped unless force is set.
+        """
+        angle = 90 if angle < 90 else 150 if angle > 150 else angle
+        self._queue_command(self._SERVO_FMT % (channel, angle), None if force else ("servo", channel))
+
+    def led(self, mode: int, r: int, g: int, b: int, mask: int = 15, force: bool = False):
+        """Set LED color. Mode: 0=off, 1=on, 2-5=animations. Mask: bitmask for LEDs 1-4
+
+        Repeats of the last LED command sent are skipped unless force is set.
+        """
+        r = 0 if r < 0 else 255 if r > 255 else r
+        g = 0 if g < 0 else 255 if g > 255 else g
+        b = 0 if b < 0 else 255 if b > 255 else b
+        self._queue_command(self._LED_FMT % (mode, r, g, b, mask), None if force else "led")
 
     def led_mode(self, mode: int):
         """Set LED animation mode."""
-        self.send_command(f"CMD_LED_MOD#{mode}")
+        with self._last_sent_lock:
+            self._last_sent.pop("led", None)  # The animation overrides the last colour
+        self._queue_command(self._LED_MOD_FMT % mode)
 
     def set_mode(self, mode: int):
         """Set robot mode. 0=free, 1=sonic, 2=line"""
-        self.send_command(f"CMD_MODE#{mode}")
+        with self._last_sent_lock:
+            self._last_sent.clear()  # Sonic/line modes drive the servos and LEDs themselves
+        self._queue_command(self._MODE_FMT % mode)
 
     def gripper(self, action: int):
         """Control gripper. 0=stop, 1=up, 2=down"""
-        self.send_command(f"CMD_ACTION#{action}")
+        self._queue_command(self._ACTION_FMT % action)
 
     def request_ultrasonic(self):
         """Request ultrasonic distance reading."""
-        self.send_command("CMD_SONIC#")
+        self._queue_command(self._SONIC_CMD)
+
+
+# Global singleton instance, created on first use
+_robot: Optional[RobotClient] = None
+
+
+def get_robot() -> RobotClient:
+    """Return the shared RobotClient, creating it on first call."""
+    global _robot
+    if _robot is None:
+        _robot = RobotClient()
+    return _robot
 
 
-# Global singleton instance
-robot = RobotClient()
+def __getattr__(name: str):
+    # Keep `from robot_client import robot` working without an import-time instance
+    if name == "robot":
+        return get_robot()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -7,6 +7,8 @@ Includes comprehensive event logging for debugging agent behavior.
 Usage:
     python test_ai_agent.py              # Interactive mode
     python test_ai_agent.py --auto       # Run automated tests
+    python test_ai_agent.py --auto --sequential  # One scenario at a time
+    python test_ai_agent.py --list-scenarios  # Show automated tests (no API key needed)
     python test_ai_agent.py --tts        # Enable TTS playback
     python test_ai_agent.py --distance 10  # Test safety blocking
     python test_ai_agent.py --verbose    # Enable debug logging
@@ -16,94 +18,166 @@ import asyncio
 import argparse
 import sys
 import logging
+import os
 import re
+import threading
+from typing import Callable, NamedTuple
 from mock_robot import MockRobotClient
 from ai_session import AISession, AgentEvent
 
-# ANSI colors for terminal output
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
+# ANSI colors for terminal output - off when piped (CI, logs) or NO_COLOR is set
+USE_COLOR = sys.stdout.isatty() and not os.environ.get("NO_COLOR")
+
+
+def sgr(*codes: str) -> str:
+    """Build one SGR escape setting all the given attribute codes at once ("" without color)."""
+    return f"\033[{';'.join(codes)}m" if USE_COLOR else ""
+
+
 class Colors:
-    RESET = "\033[0m"
-    BOLD = "\033[1m"
-    DIM = "\033[2m"
+    RESET = sgr("0")
+    BOLD = sgr("1")
+    DIM = sgr("2")
+
+    RED = sgr("31")
+    GREEN = sgr("32")
+    YELLOW = sgr("33")
+    BLUE = sgr("34")
+    MAGENTA = sgr("35")
+    CYAN = sgr("36")
+    WHITE = sgr("37")
+
+    BG_RED = sgr("41")
+    BG_GREEN = sgr("42")
+    BG_BLUE = sgr("44")
+
+    # Bold + color in a single escape sequence
+    BOLD_RED = sgr("1", "31")
+    BOLD_GREEN = sgr("1", "32")
+    BOLD_YELLOW = sgr("1", "33")
+
+
+# Pre-rendered check results for the test analysis lines
+_CHECK_PASSED = f"{Colors.GREEN}True{Colors.RESET}"
+_CHECK_FAILED = f"{Colors.RED}False{Colors.RESET}"
+_CHECK_MISSING = f"{Colors.YELLOW}False{Colors.RESET}"  # Nice to have, not required
+
+# Event formatters, one per event type; colors are baked in once at import
+_RESET = Colors.RESET
+
+
+def _format_plain(label: str) -> Callable[[AgentEvent], str]:
+    """Formatter for events shown as a colored label plus their data."""
+    def format_plain(event: AgentEvent) -> str:
+        return f"{label}{event.data}{_RESET}"
+    return format_plain
+
+
+_TOOL_CALL_LABEL = f"{Colors.CYAN}  🔧 TOOL CALL: {Colors.BOLD}"
+_TOOL_RESULT_LABEL = f"{Colors.GREEN}  ✓ TOOL RESULT: "
+
 
-    RED = "\033[31m"
-    GREEN = "\033[32m"
-    YELLOW = "\033[33m"
-    BLUE = "\033[34m"
-    MAGENTA = "\033[35m"
-    CYAN = "\033[36m"
-    WHITE = "\033[37m"
+def _format_tool_call(event: AgentEvent) -> str:
+    args = event.details.get("args", {})
+    args_str = ", ".join(f"{k}={v}" for k, v in args.items()) if args else ""
+    return f"{_TOOL_CALL_LABEL}{event.data}({args_str}){_RESET}"
 
-    BG_RED = "\033[41m"
-    BG_GREEN = "\033[42m"
-    BG_BLUE = "\033[44m"
+
+def _format_tool_result(event: AgentEvent) -> str:
+    result = str(event.details.get("result", ""))
+    # Truncate long results
+    if len(result) > 80:
+        result = result[:77] + "..."
+    return f"{_TOOL_RESULT_LABEL}{event.data} → {result}{_RESET}"
+
+
+def _format_other(event: AgentEvent) -> str:
+    return f"  {event.event_type.upper()}: {event.data}"
+
+
+_EVENT_FORMATTERS: dict[str, Callable[[AgentEvent], str]] = {
+    "env": _format_plain(f"{Colors.DIM}  📡 ENV: "),
+    "prompt": _format_plain(f"{Colors.DIM}  📝 PROMPT: "),
+    "tool_call": _format_tool_call,
+    "tool_result": _format_tool_result,
+    "response": _format_plain(f"{Colors.YELLOW}  💬 RESPONSE: "),
+    "error": _format_plain(f"{Colors.RED}  ❌ ERROR: "),
+}
 
 
 def format_event(event: AgentEvent) -> str:
     """Format an agent event with colors for terminal display."""
-    c = Colors
+    return _EVENT_FORMATTERS.get(event.event_type, _format_other)(event)
 
-    if event.event_type == "env":
-        return f"{c.DIM}  📡 ENV: {event.data}{c.RESET}"
 
-    elif event.event_type == "prompt":
-        return f"{c.DIM}  📝 PROMPT: {event.data}{c.RESET}"
+def split_tool_events(events: list[AgentEvent]) -> tuple[list[AgentEvent], list[AgentEvent]]:
+    """Split events into (tool calls, tool results) in a single pass."""
+    tool_calls, tool_results = [], []
+    for event in events:
+        if event.event_type == "tool_call":
+            tool_calls.append(event)
+        elif event.event_type == "tool_result":
+            tool_results.append(event)
+    return tool_calls, tool_results
 
-    elif event.event_type == "tool_call":
-        args = event.details.get("args", {})
-        args_str = ", ".join(f"{k}={v}" for k, v in args.items()) if args else ""
-        return f"{c.CYAN}  🔧 TOOL CALL: {c.BOLD}{event.data}({args_str}){c.RESET}"
 
-    elif event.event_type == "tool_result":
-        result = event.details.get("result", "")
-        # Truncate long results
-        if len(str(result)) > 80:
-            result = str(result)[:77] + "..."
-        return f"{c.GREEN}  ✓ TOOL RESULT: {event.data} → {result}{c.RESET}"
+def print_events(events: list[AgentEvent]):
+    """Print a batch of events (one event-loop tick's worth) to console.
 
-    elif event.event_type == "response":
-        return f"{c.YELLOW}  💬 RESPONSE: {event.data}{c.RESET}"
+    The whole batch goes out as one write, so a line-buffered terminal or pipe
+    flushes once per batch rather than per line.
+    """
+    sys.stdout.write("".join(f"{format_event(event)}\n" for event in events))
 
-    elif event.event_type == "error":
-        return f"{c.RED}  ❌ ERROR: {event.data}{c.RESET}"
 
-    else:
-        return f"  {event.event_type.upper()}: {event.data}"
+# Interactive "add" command: add "<name>" <direction> <distance_cm>
+_ADD_OBJECT_RE = re.compile(r'add\s+"([^"]+)"\s+(\w+)\s+(\d+)')
 
+# Reply keywords checked by the safety and exploration tests
+_BLOCKED_REPLY_RE = re.compile(r"block|obstacle|cannot", re.IGNORECASE)
+_FOUND_BALL_REPLY_RE = re.compile(r"found|ball|red", re.IGNORECASE)
 
-def print_event(event: AgentEvent):
-    """Print event immediately to console."""
-    print(format_event(event))
+
+class Scenario(NamedTuple):
+    """An automated test: passes if the agent calls at least one of the expected tools."""
+    command: str
+    expected: str  # Expected behavior, for the report
+    tools: tuple[str, ...]
 
 
 # Test scenarios for automated testing
 TEST_SCENARIOS = [
-    # (command, expected_behavior, expected_tools)
     # Basic perception
-    ("what do you see?", "should sense environment", ["sense"]),
-    ("check your surroundings", "should sense", ["sense"]),
+    Scenario("what do you see?", "should sense environment", ("sense",)),
+    Scenario("check your surroundings", "should sense", ("sense",)),
 
     # Distance-controlled movement
-    ("go forward 30cm", "sense + move_toward", ["sense", "move_toward"]),
-    ("move toward the wall", "sense + move_toward", ["sense", "move_toward"]),
+    Scenario("go forward 30cm", "sense + move_toward", ("sense", "move_toward")),
+    Scenario("move toward the wall", "sense + move_toward", ("sense", "move_toward")),
 
     # Timed movement
-    ("back up a bit", "move_timed backward", ["move_timed"]),
-    ("move left for a second", "move_timed left", ["move_timed"]),
+    Scenario("back up a bit", "move_timed backward", ("move_timed",)),
+    Scenario("move left for a second", "move_timed left", ("move_timed",)),
 
     # Rotation
-    ("turn left 90 degrees", "turn_degrees", ["turn_degrees"]),
-    ("look right", "turn + sense", ["turn_degrees", "sense"]),
-    ("face the other way", "turn 180", ["turn_degrees"]),
+    Scenario("turn left 90 degrees", "turn_degrees", ("turn_degrees",)),
+    Scenario("look right", "turn + sense", ("turn_degrees", "sense")),
+    Scenario("face the other way", "turn 180", ("turn_degrees",)),
 
     # Other controls
-    ("stop", "emergency stop", ["stop"]),
-    ("set the lights to red", "should set LEDs", ["set_leds"]),
-    ("close the gripper", "should pinch", ["clamp_up"]),
-    ("pan camera right", "camera servo only", ["set_servo"]),
+    Scenario("stop", "emergency stop", ("stop",)),
+    Scenario("set the lights to red", "should set LEDs", ("set_leds",)),
+    Scenario("close the gripper", "should pinch", ("clamp_up",)),
+    Scenario("pan camera right", "camera servo only", ("set_servo",)),
 
     # Multi-step with perception
-    ("pick up what's in front of me", "sense + move + grab", ["sense", "move_toward", "clamp_down", "clamp_up"]),
+    Scenario("pick up what's in front of me", "sense + move + grab", ("sense", "move_toward", "clamp_down", "clamp_up")),
 ]
 
 # Exploration test - object not initially visible
@@ -124,6 +198,31 @@ EXPLORATION_TEST = {
 }
 
 
+async def ainput(prompt: str) -> str:
+    """input() that leaves the event loop running while the user types.
+
+    Reads on a daemon thread rather than the default executor, so a pending read
+    never holds up interpreter shutdown.
+    """
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+
+    def deliver(setter, value):
+        if not future.done():
+            setter(value)
+
+    def read():
+        try:
+            line = input(prompt)
+        except BaseException as e:  # EOFError, or KeyboardInterrupt on some platforms
+            loop.call_soon_threadsafe(deliver, future.set_exception, e)
+        else:
+            loop.call_soon_threadsafe(deliver, future.set_result, line)
+
+    threading.Thread(target=read, daemon=True).start()
+    return await future
+
+
 async def interactive_mode(session: AISession, robot: MockRobotClient, tts: bool, verbose: bool):
     """Interactive testing - type commands and see responses."""
     c = Colors
@@ -153,8 +252,8 @@ The agent will interpret your commands and control the mock robot.
 
     while True:
         try:
-            cmd = input(f"\n{c.BOLD}> {c.RESET}").strip()
-        except (EOFError, KeyboardInterrupt):
+            cmd = (await ainput(f"\n{c.BOLD}> {c.RESET}")).strip()
+        except (EOFError, KeyboardInterrupt, asyncio.CancelledError):  # Ctrl+C cancels the awaiting task
             print("\nExiting...")
             break
 
@@ -228,7 +327,7 @@ The agent will interpret your commands and control the mock robot.
         if cmd.startswith("add "):
             # Parse: add "object name" direction distance
             # Example: add "red ball" left 80
-            match = re.match(r'add\s+"([^"]+)"\s+(\w+)\s+(\d+)', cmd)
+            match = _ADD_OBJECT_RE.match(cmd)
             if match:
                 name, direction, dist = match.groups()
                 robot.add_mock_object(name, direction, float(dist))
@@ -250,14 +349,13 @@ The agent will interpret your commands and control the mock robot.
         result = await session.process_text(
             cmd,
             generate_tts=tts,
-            on_event=print_event if verbose_mode else None
+            on_event_batch=print_events if verbose_mode else None
         )
 
         # If not verbose, show summary of events
         if not verbose_mode:
             events = result.get("events", [])
-            tool_calls = [e for e in events if e.event_type == "tool_call"]
-            tool_results = [e for e in events if e.event_type == "tool_result"]
+            tool_calls, tool_results = split_tool_events(events)
 
             if tool_calls:
                 print(f"\n{c.CYAN}  🔧 Tool calls:{c.RESET}")
@@ -269,9 +367,9 @@ The agent will interpret your commands and control the mock robot.
             if tool_results:
                 print(f"\n{c.GREEN}  ✓ Results:{c.RESET}")
                 for tr in tool_results:
-                    result_str = tr.details.get("result", "")
-                    if len(str(result_str)) > 60:
-                        result_str = str(result_str)[:57] + "..."
+                    result_str = str(tr.details.get("result", ""))
+                    if len(result_str) > 60:
+                        result_str = result_str[:57] + "..."
                     print(f"    {tr.data}: {result_str}")
 
         print(f"\n{c.YELLOW}  💬 Agent: {result['assistant_text']}{c.RESET}")
@@ -284,77 +382,102 @@ The agent will interpret your commands and control the mock robot.
                 print(f"    {cmd_item}")
 
 
-async def automated_tests(session: AISession, robot: MockRobotClient, verbose: bool):
-    """Run automated test scenarios with detailed reporting."""
+async def run_scenario(
+    session: AISession,
+    robot: MockRobotClient,
+    scenario: Scenario,
+    verbose: bool,
+    emit: Callable[[str], None] = print
+) -> dict:
+    """Run one test scenario, reporting through emit(); returns {"command", "success"}.
+
+    The report goes out in a few multi-line blocks (header, live events, outcome)
+    rather than line by line, so each costs one write.
+    """
     c = Colors
+    cmd = scenario.command
+    robot.clear_log()
 
-    print(f"\n{c.BOLD}{'=' * 70}{c.RESET}")
-    print(f"{c.BOLD}  🧪 AI Agent Test Mode (Automated){c.RESET}")
-    print(f"{c.BOLD}{'=' * 70}{c.RESET}")
+    emit(
+        f"\n{c.BOLD}Test: \"{cmd}\"{c.RESET}\n"
+        f"{c.DIM}  Expected: {scenario.expected}{c.RESET}\n"
+        f"{c.DIM}  Expected tools: {', '.join(scenario.tools)}{c.RESET}"
+    )
 
-    passed = 0
-    failed = 0
-    results = []
+    try:
+        await session._ensure_initialized()
+        result = await session.process_text(
+            cmd,
+            generate_tts=False,
+            on_event_batch=(lambda events: emit("\n".join(map(format_event, events)))) if verbose else None
+        )
 
-    for cmd, expected, expected_tools in TEST_SCENARIOS:
-        robot.clear_log()
+        # Extract events
+        events = result.get("events", [])
+        tool_calls = [e.data for e in events if e.event_type == "tool_call"]
 
-        print(f"\n{c.BOLD}Test: \"{cmd}\"{c.RESET}")
-        print(f"{c.DIM}  Expected: {expected}{c.RESET}")
-        print(f"{c.DIM}  Expected tools: {expected_tools}{c.RESET}")
+        # Check for errors
+        has_error = "Error" in (result.get("assistant_text") or "")
 
-        try:
-            result = await session.process_text(
-                cmd,
-                generate_tts=False,
-                on_event=print_event if verbose else None
-            )
+        # Check if expected tools were called (at least one)
+        tools_matched = not set(tool_calls).isdisjoint(scenario.tools) if scenario.tools else True
 
-            # Extract events
-            events = result.get("events", [])
-            tool_calls = [e.data for e in events if e.event_type == "tool_call"]
+        success = not has_error and (tools_matched or result.get("assistant_text"))
 
-            # Check for errors
-            has_error = "Error" in (result.get("assistant_text") or "")
+        report = []
+        if not verbose:
+            # Show tool calls
+            if tool_calls:
+                report.append(f"{c.CYAN}  🔧 Tool calls: {tool_calls}{c.RESET}")
 
-            # Check if expected tools were called (at least one)
-            tools_matched = any(t in tool_calls for t in expected_tools) if expected_tools else True
+        report.append(f"{c.YELLOW}  💬 Response: {result['assistant_text']}{c.RESET}")
+        report.append(f"  📤 Robot commands: {robot.get_command_log()}")
 
-            success = not has_error and (tools_matched or result.get("assistant_text"))
+        if success:
+            report.append(f"{c.BOLD_GREEN}  ✅ PASS{c.RESET}")
+        else:
+            report.append(f"{c.BOLD_RED}  ❌ FAIL{c.RESET}")
+            if not tools_matched:
+                report.append(f"{c.RED}    Expected tools {list(scenario.tools)} but got {tool_calls}{c.RESET}")
+        emit("\n".join(report))
 
-            if not verbose:
-                # Show tool calls
-                if tool_calls:
-                    print(f"{c.CYAN}  🔧 Tool calls: {tool_calls}{c.RESET}")
+        # Only what the summary needs - the details were already reported
+        return {"command": cmd, "success": bool(success)}
 
-            print(f"{c.YELLOW}  💬 Response: {result['assistant_text']}{c.RESET}")
-            print(f"  📤 Robot commands: {robot.get_command_log()}")
+    except Exception as e:
+        emit(f"{c.RED}  ❌ Exception: {e}{c.RESET}")
+        return {"command": cmd, "success": False}
 
-            if success:
-                print(f"{c.GREEN}{c.BOLD}  ✅ PASS{c.RESET}")
-                passed += 1
-            else:
-                print(f"{c.RED}{c.BOLD}  ❌ FAIL{c.RESET}")
-                if not tools_matched:
-                    print(f"{c.RED}    Expected tools {expected_tools} but got {tool_calls}{c.RESET}")
-                failed += 1
-
-            results.append({
-                "command": cmd,
-                "success": success,
-                "tool_calls": tool_calls,
-                "response": result.get("assistant_text"),
-                "robot_commands": robot.get_command_log()
-            })
-
-        except Exception as e:
-            print(f"{c.RED}  ❌ Exception: {e}{c.RESET}")
-            failed += 1
-            results.append({
-                "command": cmd,
-                "success": False,
-                "error": str(e)
-            })
+
+async def automated_tests(session: AISession, robot: MockRobotClient, verbose: bool, sequential: bool = False):
+    """Run automated test scenarios with detailed reporting.
+
+    Scenarios run concurrently, each with its own mock robot and AI session so
+    command logs and conversations stay separate; reports print in scenario order.
+    With sequential=True they run one by one on the given session, reporting live.
+    """
+    c = Colors
+
+    print(f"\n{c.BOLD}{'=' * 70}{c.RESET}")
+    print(f"{c.BOLD}  🧪 AI Agent Test Mode (Automated){c.RESET}")
+    print(f"{c.BOLD}{'=' * 70}{c.RESET}")
+
+    if sequential:
+        results = [await run_scenario(session, robot, scenario, verbose) for scenario in TEST_SCENARIOS]
+    else:
+        async def run_isolated(scenario: Scenario) -> tuple[dict, list[str]]:
+            scenario_robot = MockRobotClient(ultrasonic=robot.sensors.ultrasonic, verbose=False)
+            report: list[str] = []
+            result = await run_scenario(AISession(scenario_robot, local_plans=False), scenario_robot, scenario, verbose, report.append)
+            return result, report
+
+        outcomes = await asyncio.gather(*(run_isolated(scenario) for scenario in TEST_SCENARIOS))
+        results = [result for result, _ in outcomes]
+        sys.stdout.write("".join(f"{block}\n" for _, report in outcomes for block in report))
+        sys.stdout.flush()
+
+    passed = sum(1 for r in results if r["success"])
+    failed = len(results) - passed
 
     # Summary
     print(f"\n{c.BOLD}{'=' * 70}{c.RESET}")
@@ -394,37 +517,35 @@ async def safety_test(session: AISession, robot: MockRobotClient, verbose: bool)
     result = await session.process_text(
         "move forward",
         generate_tts=False,
-        on_event=print_event if verbose else None
+        on_event_batch=print_events if verbose else None
     )
 
     events = result.get("events", [])
-    tool_calls = [e.data for e in events if e.event_type == "tool_call"]
-    tool_results = [e for e in events if e.event_type == "tool_result"]
+    call_events, tool_results = split_tool_events(events)
+    tool_calls = [e.data for e in call_events]
 
     print(f"\n  🔧 Tool calls: {tool_calls}")
     print(f"  💬 Response: {result['assistant_text']}")
-    print(f"  📤 Robot commands: {robot.get_command_log()}")
+    command_log = robot.get_command_log()  # A copy - take it once
+    print(f"  📤 Robot commands: {command_log}")
 
     # Check if blocked
-    response_lower = (result.get("assistant_text") or "").lower()
-    blocked = "block" in response_lower or "obstacle" in response_lower or "cannot" in response_lower
+    blocked = _BLOCKED_REPLY_RE.search(result.get("assistant_text") or "") is not None
 
-    # Check tool results for BLOCKED
-    for tr in tool_results:
-        if "BLOCKED" in str(tr.details.get("result", "")):
-            blocked = True
+    # Check tool results for BLOCKED (stops at the first hit; skipped if the reply already says so)
+    blocked = blocked or any("BLOCKED" in str(tr.details.get("result", "")) for tr in tool_results)
 
     # Check if motor command was actually sent (bad)
     motor_forward = any(
         "CMD_MOTOR" in cmd and "#0#0" not in cmd
-        for cmd in robot.get_command_log()
+        for cmd in command_log
     )
 
     if blocked or not motor_forward:
-        print(f"\n  {c.GREEN}{c.BOLD}✅ PASS - Safety blocking worked!{c.RESET}")
+        print(f"\n  {c.BOLD_GREEN}✅ PASS - Safety blocking worked!{c.RESET}")
         return True
     else:
-        print(f"\n  {c.RED}{c.BOLD}❌ FAIL - Motor command sent despite obstacle!{c.RESET}")
+        print(f"\n  {c.BOLD_RED}❌ FAIL - Motor command sent despite obstacle!{c.RESET}")
         return False
 
 
@@ -448,12 +569,12 @@ async def exploration_test(session: AISession, robot: MockRobotClient, verbose:
     print(f"     Hidden object: red ball (to the LEFT, 80cm away)")
     print(f"     Robot facing: forward (ball not visible)")
     print(f"\n  🎯 Command: \"find the red ball\"")
-    print(f"\n  Expected: Agent should scan (turn + sense), find ball, navigate to it")
+    print(f"\n  Expected: Agent should scan (scan_360, or turn + sense), find ball, navigate to it")
 
     result = await session.process_text(
         "find the red ball",
         generate_tts=False,
-        on_event=print_event if verbose else None
+        on_event_batch=print_events if verbose else None
     )
 
     events = result.get("events", [])
@@ -464,27 +585,28 @@ async def exploration_test(session: AISession, robot: MockRobotClient, verbose:
     print(f"  📤 Robot commands: {robot.get_command_log()[:10]}")  # First 10
 
     # Check for exploration behavior
-    has_sense = "sense" in tool_calls
-    has_turn = "turn_degrees" in tool_calls
+    # scan_360 turns and senses inside the tool, so it counts for both
+    has_scan = "scan_360" in tool_calls
+    has_sense = "sense" in tool_calls or has_scan
+    has_turn = "turn_degrees" in tool_calls or has_scan
     has_move = "move_toward" in tool_calls or "move_timed" in tool_calls
 
     # Check if agent mentioned finding the ball
-    response_lower = (result.get("assistant_text") or "").lower()
-    found_ball = "found" in response_lower or "ball" in response_lower or "red" in response_lower
+    found_ball = _FOUND_BALL_REPLY_RE.search(result.get("assistant_text") or "") is not None
 
     print(f"\n  📊 Analysis:")
-    print(f"     Used sense(): {c.GREEN if has_sense else c.RED}{has_sense}{c.RESET}")
-    print(f"     Used turn_degrees(): {c.GREEN if has_turn else c.YELLOW}{has_turn}{c.RESET}")
-    print(f"     Used movement: {c.GREEN if has_move else c.YELLOW}{has_move}{c.RESET}")
-    print(f"     Mentioned finding ball: {c.GREEN if found_ball else c.RED}{found_ball}{c.RESET}")
+    print(f"     Used sense()/scan_360(): {_CHECK_PASSED if has_sense else _CHECK_FAILED}")
+    print(f"     Turned (turn_degrees()/scan_360()): {_CHECK_PASSED if has_turn else _CHECK_MISSING}")
+    print(f"     Used movement: {_CHECK_PASSED if has_move else _CHECK_MISSING}")
+    print(f"     Mentioned finding ball: {_CHECK_PASSED if found_ball else _CHECK_FAILED}")
 
     # Success if agent used perception and either found it or made progress
     success = has_sense and (found_ball or has_turn)
 
     if success:
-        print(f"\n  {c.GREEN}{c.BOLD}✅ PASS - Agent explored and found the ball!{c.RESET}")
+        print(f"\n  {c.BOLD_GREEN}✅ PASS - Agent explored and found the ball!{c.RESET}")
     else:
-        print(f"\n  {c.YELLOW}{c.BOLD}⚠️ PARTIAL - Agent attempted but may need improvement{c.RESET}")
+        print(f"\n  {c.BOLD_YELLOW}⚠️ PARTIAL - Agent attempted but may need improvement{c.RESET}")
 
     return success
 
@@ -497,6 +619,8 @@ async def main():
 Examples:
   python test_ai_agent.py              # Interactive mode
   python test_ai_agent.py --auto       # Run automated tests
+  python test_ai_agent.py --auto --sequential  # One scenario at a time
+  python test_ai_agent.py --list-scenarios  # List automated tests and exit
   python test_ai_agent.py --verbose    # Show all events
   python test_ai_agent.py --tts        # Enable TTS playback
   python test_ai_agent.py --distance 10  # Test with close obstacle
@@ -505,13 +629,21 @@ Examples:
         """
     )
     parser.add_argument("--auto", action="store_true", help="Run automated tests")
+    parser.add_argument("--sequential", action="store_true", help="Run automated tests one at a time")
     parser.add_argument("--safety", action="store_true", help="Run safety test only")
     parser.add_argument("--explore", action="store_true", help="Run exploration test")
     parser.add_argument("--tts", action="store_true", help="Enable TTS output")
     parser.add_argument("--verbose", "-v", action="store_true", help="Verbose event logging")
     parser.add_argument("--distance", type=float, default=50.0, help="Initial ultrasonic distance (cm)")
+    parser.add_argument("--list-scenarios", action="store_true", help="List automated test scenarios and exit")
     args = parser.parse_args()
 
+    if args.list_scenarios:
+        # No Gemini setup needed just to show the scenarios
+        for scenario in TEST_SCENARIOS:
+            print(f"{scenario.command!r:36} {scenario.expected:24} tools: {', '.join(scenario.tools)}")
+        return
+
     # Configure logging
     log_level = logging.DEBUG if args.verbose else logging.WARNING
     logging.basicConfig(
@@ -522,7 +654,8 @@ Examples:
 
     # Create mock robot and AI session
     robot = MockRobotClient(ultrasonic=args.distance)
-    session = AISession(robot)
+    # Test modes must exercise the agent, not the local fast-path for common commands
+    session = AISession(robot, local_plans=not (args.auto or args.safety or args.explore))
 
     c = Colors
     print(f"\n{c.CYAN}🔑 Initializing Gemini API...{c.RESET}")
@@ -545,11 +678,14 @@ Examples:
         success = await exploration_test(session, robot, args.verbose)
         sys.exit(0 if success else 1)
     elif args.auto:
-        success = await automated_tests(session, robot, args.verbose)
+        success = await automated_tests(session, robot, args.verbose, args.sequential)
         sys.exit(0 if success else 1)
     else:
         await interactive_mode(session, robot, args.tts, args.verbose)
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    if UVLOOP_AVAILABLE:
+        uvloop.run(main())
+    else:
+        asyncio.run(main())
@@ -8,29 +8,65 @@ Usage:
     python test_tts_stt.py              # Run all tests
     python test_tts_stt.py --tts-only   # Test TTS only
     python test_tts_stt.py --stt-only   # Test STT only
-    python test_tts_stt.py --play       # Play generated audio (requires ffplay)
+    python test_tts_stt.py --play       # Play generated audio (sounddevice or ffplay)
+    python test_tts_stt.py --batch      # Generate TTS phrases via the Batch API
+    python test_tts_stt.py --no-cache   # Don't reuse cached TTS audio
+    python test_tts_stt.py --record-reference  # (Re)record the reference clips
+    python test_tts_stt.py --audio-verify  # Compare TTS audio against reference clips
+
+Audio verification compares each freshly generated round-trip clip against a
+reference clip under tts_reference/<voice>/. No clips ship with the repo, so
+--record-reference is a required first step: run it once with your API key,
+listen to the saved clips, and commit them (re-record after changing
+TTS_MODEL, TTS_VOICE or the phrases). Until then --audio-verify refuses to
+run and lists the missing clips.
+
+The score is the peak normalized cross-correlation of the two waveforms
+(1.0 = identical up to a small time shift). Gemini TTS is not deterministic,
+so two good renditions of the same phrase rarely score near 1; the threshold
+only flags clips that no longer resemble the approved reference (wrong words,
+truncation, silence, another voice).
 """
 
 import asyncio
 import argparse
 import base64
-import io
+import hashlib
 import os
 import struct
-import subprocess
 import tempfile
-import wave
 from pathlib import Path
+from typing import Optional
 
 from dotenv import load_dotenv, find_dotenv
 from google import genai
-from google.genai import types
+from google.genai import errors, types
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+try:
+    import sounddevice as sd
+    SOUNDDEVICE_AVAILABLE = NUMPY_AVAILABLE
+except (ImportError, OSError):  # OSError: PortAudio library not found
+    SOUNDDEVICE_AVAILABLE = False
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
 
 # Load .env from repo root
 load_dotenv(find_dotenv())
 
 
 # Configuration - same as ai_session.py
+API_TIMEOUT_MS = 60_000  # Per-request HTTP timeout
 STT_MODEL = "gemini-3-flash-preview"  # Transcription
 TTS_MODEL = "gemini-2.5-flash-preview-tts"  # Dedicated TTS model
 TTS_VOICE = "Puck"  # One of 30 available voices
@@ -39,18 +75,88 @@ TTS_VOICE = "Puck"  # One of 30 available voices
 TTS_SAMPLE_RATE = 24000  # 24kHz
 TTS_CHANNELS = 1  # Mono
 TTS_SAMPLE_WIDTH = 2  # 16-bit
+TTS_PCM_MIME_TYPE = f"audio/L16;rate={TTS_SAMPLE_RATE};channels={TTS_CHANNELS}"
+
+TTS_CONCURRENCY = 5  # Max TTS requests in flight at once
+ROUND_TRIP_CONCURRENCY = 4  # Max API calls in flight during STT round trips
+
+# Generated audio is cached on disk across runs (disable with --no-cache)
+TTS_CACHE_ENABLED = True
+TTS_CACHE_DIR = Path(tempfile.gettempdir()) / "tts_test_cache"
+
+# Audio verification (--audio-verify, --record-reference)
+TTS_REFERENCE_DIR = Path(__file__).resolve().parent / "tts_reference"
+AUDIO_VERIFY_MAX_LAG = TTS_SAMPLE_RATE // 10  # Search +/-100 ms of misalignment
+AUDIO_VERIFY_THRESHOLD = 0.5  # Min peak correlation to call two clips the same
+
+# Batch API (--batch)
+BATCH_POLL_INTERVAL = 10  # Seconds between job status checks
+BATCH_DONE_STATES = {"JOB_STATE_SUCCEEDED", "JOB_STATE_FAILED", "JOB_STATE_CANCELLED", "JOB_STATE_EXPIRED"}
+
+
+# Leading four bytes (big-endian) of the audio containers test_stt recognises
+_MIME_MAGIC = {
+    0x52494646: "audio/wav",  # 'RIFF'
+    0x4F676753: "audio/ogg",  # 'OggS'
+}
+_ID3_MAGIC = 0x494433  # 'ID3' tag in front of an MP3 (first three bytes)
+_MP3_SYNC = 0xFFFB  # MPEG-1 Layer III frame sync (first two bytes)
+
+# 44-byte RIFF/WAVE header for TTS-format PCM; the two size fields are patched per clip
+_WAV_HEADER = struct.Struct('<4sI4s4sIHHIIHH4sI')
 
 
 def pcm_to_wav(pcm_data: bytes, sample_rate: int = TTS_SAMPLE_RATE,
                channels: int = TTS_CHANNELS, sample_width: int = TTS_SAMPLE_WIDTH) -> bytes:
     """Convert raw PCM audio to WAV format."""
-    buffer = io.BytesIO()
-    with wave.open(buffer, 'wb') as wav_file:
-        wav_file.setnchannels(channels)
-        wav_file.setsampwidth(sample_width)
-        wav_file.setframerate(sample_rate)
-        wav_file.writeframes(pcm_data)
-    return buffer.getvalue()
+    header = _WAV_HEADER.pack(
+        b'RIFF', 36 + len(pcm_data), b'WAVE',
+        b'fmt ', 16, 1, channels, sample_rate,
+        sample_rate * channels * sample_width, channels * sample_width, sample_width * 8,
+        b'data', len(pcm_data)
+    )
+    return header + pcm_data
+
+
+def _ncc_peak(a, b, max_lag):
+    """Peak |cross-correlation| of a and b over lags in [-max_lag, max_lag], normalized."""
+    scores = np.zeros(2 * max_lag + 1)
+    for index in prange(2 * max_lag + 1):
+        lag = index - max_lag
+        acc = 0.0
+        for i in range(max(0, -lag), min(a.shape[0], b.shape[0] - lag)):
+            acc += a[i] * b[i + lag]
+        scores[index] = abs(acc)
+    norm = np.sqrt(np.sum(a * a) * np.sum(b * b))
+    return scores.max() / norm if norm > 0 else 0.0
+
+
+if NUMBA_AVAILABLE:
+    _ncc_peak = njit(parallel=True, fastmath=True, cache=True)(_ncc_peak)
+
+
+def audio_similarity(audio_data: bytes, reference: bytes, max_lag: int = AUDIO_VERIFY_MAX_LAG) -> float:
+    """Compare two TTS PCM clips by peak normalized cross-correlation.
+
+    Returns:
+        Score in 0..1 - 1 means identical up to a shift of at most max_lag samples
+    """
+    a = np.frombuffer(audio_data, dtype=np.int16).astype(np.float64)
+    b = np.frombuffer(reference, dtype=np.int16).astype(np.float64)
+    a -= a.mean() if a.size else 0.0
+    b -= b.mean() if b.size else 0.0
+    if NUMBA_AVAILABLE:
+        return float(_ncc_peak(a, b, max_lag))
+
+    # Same correlation via FFT; the pure-Python loop would be far too slow at 24 kHz
+    norm = np.sqrt(np.sum(a * a) * np.sum(b * b))
+    if norm == 0:
+        return 0.0
+    size = 1 << (a.size + b.size + 2 * max_lag).bit_length()
+    corr = np.fft.irfft(np.fft.rfft(b, size) * np.conj(np.fft.rfft(a, size)), size)
+    window = np.concatenate((corr[-max_lag:], corr[:max_lag + 1])) if max_lag else corr[:1]
+    return float(np.abs(window).max() / norm)
+
 
 # Test phrases for TTS
 TTS_TEST_PHRASES = [
@@ -61,6 +167,17 @@ TTS_TEST_PHRASES = [
     "Scanning the area for objects.",
 ]
 
+# Phrases spoken and transcribed back by the STT round-trip tests
+STT_TEST_PHRASES = [
+    "Move forward",
+    "Turn left 90 degrees",
+    "What do you see",
+]
+
+# Integration test: what the "user" says and how the robot replies
+INTEGRATION_USER_PHRASE = "move forward slowly"
+INTEGRATION_ROBOT_RESPONSE = "Moving forward at slow speed."
+
 
 class Colors:
     GREEN = "\033[92m"
@@ -78,59 +195,104 @@ def print_header(title: str):
     print(f"{Colors.BOLD}{'=' * 60}{Colors.RESET}")
 
 
-async def test_tts(client: genai.Client, phrase: str, play: bool = False) -> dict:
-    """Test TTS generation for a single phrase.
+# Voice settings shared by interactive and batch TTS requests
+TTS_CONFIG = types.GenerateContentConfig(
+    response_modalities=["AUDIO"],
+    speech_config=types.SpeechConfig(
+        voice_config=types.VoiceConfig(
+            prebuilt_voice_config=types.PrebuiltVoiceConfig(
+                voice_name=TTS_VOICE
+            )
+        )
+    )
+)
 
-    Returns:
-        dict with keys: success, phrase, audio_size, error
-    """
-    result = {
+
+def _tts_cache_path(phrase: str) -> Path:
+    key = hashlib.sha256(f"{TTS_MODEL}|{TTS_VOICE}|{phrase}".encode()).hexdigest()
+    return TTS_CACHE_DIR / f"{key}.pcm"
+
+
+def tts_cache_get(phrase: str):
+    """Return cached PCM audio for a phrase, or None on a miss."""
+    try:
+        return _tts_cache_path(phrase).read_bytes()
+    except OSError:
+        return None
+
+
+def tts_cache_put(phrase: str, audio_data: bytes):
+    """Store PCM audio for a phrase (best effort)."""
+    try:
+        TTS_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        _tts_cache_path(phrase).write_bytes(audio_data)
+    except OSError:
+        pass
+
+
+def new_tts_result(phrase: str) -> dict:
+    """Empty (failed) TTS result for a phrase."""
+    return {
         "success": False,
         "phrase": phrase,
         "audio_size": 0,
         "error": None,
-        "audio_data": None
+        "audio_data": None,
+        "cached": False
     }
 
-    try:
-        response = client.models.generate_content(
-            model=TTS_MODEL,
-            contents=phrase,
-            config=types.GenerateContentConfig(
-                response_modalities=["AUDIO"],
-                speech_config=types.SpeechConfig(
-                    voice_config=types.VoiceConfig(
-                        prebuilt_voice_config=types.PrebuiltVoiceConfig(
-                            voice_name=TTS_VOICE
-                        )
-                    )
-                )
-            )
-        )
 
-        if not response.candidates:
-            result["error"] = "No candidates in response"
-            return result
+def parse_tts_response(response, result: dict) -> dict:
+    """Fill a TTS result dict from a generate_content response."""
+    if not response.candidates:
+        result["error"] = "No candidates in response"
+        return result
+
+    candidate = response.candidates[0]
+    if not candidate.content or not candidate.content.parts:
+        result["error"] = "No content parts in response"
+        return result
 
-        candidate = response.candidates[0]
-        if not candidate.content or not candidate.content.parts:
-            result["error"] = "No content parts in response"
+    for part in candidate.content.parts:
+        if hasattr(part, 'inline_data') and part.inline_data:
+            audio_data = part.inline_data.data
+            result["audio_size"] = len(audio_data)
+            result["audio_data"] = audio_data
+            result["success"] = True
             return result
 
-        for part in candidate.content.parts:
-            if hasattr(part, 'inline_data') and part.inline_data:
-                audio_data = part.inline_data.data
-                result["audio_size"] = len(audio_data)
-                result["audio_data"] = audio_data
-                result["success"] = True
+    result["error"] = "No audio data in response parts"
+    return result
+
 
-                # Optionally play the audio
-                if play and audio_data:
-                    await play_audio(audio_data)
+async def test_tts(client: genai.Client, phrase: str, play: bool = False) -> dict:
+    """Test TTS generation for a single phrase.
 
-                return result
+    Audio is served from the on-disk cache when available.
+
+    Returns:
+        dict with keys: success, phrase, audio_size, error, audio_data, cached
+    """
+    result = new_tts_result(phrase)
+
+    try:
+        cached = await asyncio.to_thread(tts_cache_get, phrase) if TTS_CACHE_ENABLED else None
+        if cached:
+            result.update(success=True, audio_size=len(cached), audio_data=cached, cached=True)
+        else:
+            response = await client.aio.models.generate_content(
+                model=TTS_MODEL,
+                contents=phrase,
+                config=TTS_CONFIG
+            )
+            parse_tts_response(response, result)
+            if TTS_CACHE_ENABLED and result["success"]:
+                await asyncio.to_thread(tts_cache_put, phrase, result["audio_data"])
+
+        # Optionally play the audio
+        if play and result["audio_data"]:
+            await play_audio(result["audio_data"])
 
-        result["error"] = "No audio data in response parts"
         return result
 
     except Exception as e:
@@ -138,6 +300,84 @@ async def test_tts(client: genai.Client, phrase: str, play: bool = False) -> dic
         return result
 
 
+def _reference_path(phrase: str) -> Path:
+    slug = "".join(c if c.isalnum() else "_" for c in phrase.lower()).strip("_")
+    return TTS_REFERENCE_DIR / TTS_VOICE / f"{slug}.pcm"
+
+
+def missing_references(phrases: list[str]) -> list[str]:
+    """Return the phrases that have no reference clip checked in."""
+    return [phrase for phrase in phrases if not _reference_path(phrase).is_file()]
+
+
+def record_reference(phrase: str, audio_data: bytes):
+    """Save TTS audio as the reference clip for a phrase."""
+    path = _reference_path(phrase)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(audio_data)
+
+
+def verify_audio(phrase: str, audio_data: bytes) -> float:
+    """Score TTS audio against the checked-in reference clip for a phrase.
+
+    Returns:
+        audio_similarity score (see the module docstring for what it means)
+    """
+    return audio_similarity(audio_data, _reference_path(phrase).read_bytes())
+
+
+async def test_tts_batch(client: genai.Client, phrases: list[str]) -> list[dict]:
+    """Generate TTS for several phrases in one Batch API job.
+
+    Batch jobs are billed at half the interactive price but can take
+    minutes to complete, so this polls until the job finishes.
+
+    Returns:
+        One test_tts-style result dict per phrase, in order
+    """
+    results = [new_tts_result(phrase) for phrase in phrases]
+
+    try:
+        job = await client.aio.batches.create(
+            model=TTS_MODEL,
+            src=[types.InlinedRequest(contents=phrase, config=TTS_CONFIG) for phrase in phrases],
+            config=types.CreateBatchJobConfig(display_name="tts-test-phrases")
+        )
+        print(f"{Colors.DIM}Submitted batch job {job.name}, polling every {BATCH_POLL_INTERVAL}s...{Colors.RESET}")
+
+        while job.state.name not in BATCH_DONE_STATES:
+            await asyncio.sleep(BATCH_POLL_INTERVAL)
+            job = await client.aio.batches.get(name=job.name)
+    except Exception as e:
+        for result in results:
+            result["error"] = str(e)
+        return results
+
+    if job.state.name != "JOB_STATE_SUCCEEDED":
+        for result in results:
+            result["error"] = f"Batch job ended with {job.state.name}"
+        return results
+
+    for result, inlined in zip(results, job.dest.inlined_responses):
+        if inlined.error:
+            result["error"] = str(inlined.error)
+        else:
+            parse_tts_response(inlined.response, result)
+
+    return results
+
+
+async def transcribe(client: genai.Client, audio_data: bytes, mime_type: str):
+    """Ask the STT model for a verbatim transcription of an audio clip."""
+    return await client.aio.models.generate_content(
+        model=STT_MODEL,
+        contents=[
+            "Transcribe this audio exactly. Return only the transcription.",
+            types.Part.from_bytes(data=audio_data, mime_type=mime_type)
+        ]
+    )
+
+
 async def test_stt(client: genai.Client, audio_data: bytes, expected_text: str = None,
                    is_raw_pcm: bool = False) -> dict:
     """Test STT transcription.
@@ -146,7 +386,7 @@ async def test_stt(client: genai.Client, audio_data: bytes, expected_text: str =
         client: Gemini client
         audio_data: Raw audio bytes (PCM or WAV)
         expected_text: Optional expected transcription for validation
-        is_raw_pcm: If True, audio_data is raw PCM and needs WAV conversion
+        is_raw_pcm: If True, audio_data is raw TTS-format PCM (sent as audio/L16)
 
     Returns:
         dict with keys: success, transcription, error
@@ -159,26 +399,24 @@ async def test_stt(client: genai.Client, audio_data: bytes, expected_text: str =
     }
 
     try:
-        # Convert raw PCM to WAV if needed
         if is_raw_pcm:
-            audio_data = pcm_to_wav(audio_data)
-
-        # Detect mime type from audio data
-        mime_type = "audio/wav"  # Default
-        if audio_data[:4] == b'RIFF':
-            mime_type = "audio/wav"
-        elif audio_data[:3] == b'ID3' or audio_data[:2] == b'\xff\xfb':
-            mime_type = "audio/mpeg"
-        elif audio_data[:4] == b'OggS':
-            mime_type = "audio/ogg"
-
-        response = client.models.generate_content(
-            model=STT_MODEL,
-            contents=[
-                "Transcribe this audio exactly. Return only the transcription.",
-                types.Part.from_bytes(data=audio_data, mime_type=mime_type)
-            ]
-        )
+            # Upload the PCM as-is rather than copying it into a WAV container
+            mime_type = TTS_PCM_MIME_TYPE
+        else:
+            # Detect mime type from audio data
+            magic = int.from_bytes(audio_data[:4], 'big')
+            if magic >> 8 == _ID3_MAGIC or magic >> 16 == _MP3_SYNC:
+                mime_type = "audio/mpeg"
+            else:
+                mime_type = _MIME_MAGIC.get(magic, "audio/wav")  # Default to WAV
+
+        try:
+            response = await transcribe(client, audio_data, mime_type)
+        except errors.ClientError:
+            if not is_raw_pcm:
+                raise
+            # Model rejected raw L16 - fall back to wrapping it as WAV
+            response = await transcribe(client, pcm_to_wav(audio_data), "audio/wav")
 
         transcription = response.text.strip()
         result["transcription"] = transcription
@@ -225,49 +463,116 @@ async def test_round_trip(client: genai.Client, phrase: str) -> dict:
 
 
 async def play_audio(audio_data: bytes):
-    """Play audio using ffplay if available."""
+    """Play TTS PCM audio with sounddevice, or ffplay if it isn't installed."""
+    if SOUNDDEVICE_AVAILABLE:
+        try:
+            sd.play(np.frombuffer(audio_data, dtype=np.int16), TTS_SAMPLE_RATE)
+            await asyncio.to_thread(sd.wait)
+        except Exception as e:
+            print(f"{Colors.DIM}  (Playback error: {e}){Colors.RESET}")
+        return
+
+    fd, temp_path = tempfile.mkstemp(suffix=".wav")
     try:
-        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as f:
-            f.write(audio_data)
-            temp_path = f.name
-
-        # Try ffplay (comes with ffmpeg)
-        subprocess.run(
-            ["ffplay", "-nodisp", "-autoexit", "-loglevel", "quiet", temp_path],
-            check=True
+        with os.fdopen(fd, "wb") as f:
+            f.write(pcm_to_wav(audio_data))  # ffplay can't probe headerless PCM
+
+        # Try ffplay (comes with ffmpeg) without blocking the event loop
+        proc = await asyncio.create_subprocess_exec(
+            "ffplay", "-nodisp", "-autoexit", "-loglevel", "quiet", temp_path,
+            stdout=asyncio.subprocess.DEVNULL, stderr=asyncio.subprocess.DEVNULL
         )
-        os.unlink(temp_path)
+        if await proc.wait() != 0:
+            print(f"{Colors.DIM}  (Playback error: ffplay exited with {proc.returncode}){Colors.RESET}")
     except FileNotFoundError:
         print(f"{Colors.DIM}  (ffplay not found - skipping playback){Colors.RESET}")
     except Exception as e:
         print(f"{Colors.DIM}  (Playback error: {e}){Colors.RESET}")
+    finally:
+        os.unlink(temp_path)
+
 
+async def prefetch_tts(client: genai.Client, phrases) -> dict:
+    """Generate TTS for every distinct phrase concurrently.
 
-async def run_tts_tests(client: genai.Client, play: bool = False):
-    """Run TTS tests for all test phrases."""
+    Returns:
+        {phrase: test_tts result dict}, to hand to the runners as tts_audio
+    """
+    unique = list(dict.fromkeys(phrases))
+    semaphore = asyncio.Semaphore(TTS_CONCURRENCY)
+
+    async def generate(phrase: str) -> dict:
+        async with semaphore:
+            return await test_tts(client, phrase, play=False)
+
+    results = await asyncio.gather(*(generate(phrase) for phrase in unique), return_exceptions=True)
+
+    tts_audio = {}
+    for phrase, result in zip(unique, results):
+        if isinstance(result, BaseException):
+            failure = new_tts_result(phrase)
+            failure["error"] = str(result) or type(result).__name__
+            result = failure
+        tts_audio[phrase] = result
+    return tts_audio
+
+
+async def cached_tts(client: genai.Client, phrase: str, tts_audio: Optional[dict]) -> dict:
+    """TTS result for a phrase, reusing one from prefetch_tts when available."""
+    if tts_audio and phrase in tts_audio:
+        return tts_audio[phrase]
+    return await test_tts(client, phrase, play=False)
+
+
+async def run_tts_tests(client: genai.Client, play: bool = False, batch: bool = False,
+                        tts_audio: Optional[dict] = None):
+    """Run TTS tests for all test phrases.
+
+    tts_audio holds audio already generated by prefetch_tts (ignored with batch).
+    """
     print_header("TTS (Text-to-Speech) Tests")
 
     passed = 0
     failed = 0
 
-    for phrase in TTS_TEST_PHRASES:
-        print(f"\n{Colors.CYAN}Testing:{Colors.RESET} \"{phrase[:50]}...\"" if len(phrase) > 50 else f"\n{Colors.CYAN}Testing:{Colors.RESET} \"{phrase}\"")
+    if batch:
+        results = await test_tts_batch(client, TTS_TEST_PHRASES)
+    else:
+        # Generate whatever wasn't prefetched concurrently, capped to stay under rate limits
+        tts_audio = dict(tts_audio or {})
+        missing = [phrase for phrase in TTS_TEST_PHRASES if phrase not in tts_audio]
+        tts_audio.update(await prefetch_tts(client, missing))
+        results = [tts_audio[phrase] for phrase in TTS_TEST_PHRASES]
 
-        result = await test_tts(client, phrase, play=play)
+    for phrase, result in zip(TTS_TEST_PHRASES, results):
+        print(f"\n{Colors.CYAN}Testing:{Colors.RESET} \"{phrase[:50]}...\"" if len(phrase) > 50 else f"\n{Colors.CYAN}Testing:{Colors.RESET} \"{phrase}\"")
 
         if result["success"]:
-            print(f"  {Colors.GREEN}PASS{Colors.RESET} - Generated {result['audio_size']:,} bytes of audio")
+            source = " (cached)" if result["cached"] else ""
+            print(f"  {Colors.GREEN}PASS{Colors.RESET} - Generated {result['audio_size']:,} bytes of audio{source}")
             passed += 1
         else:
             print(f"  {Colors.RED}FAIL{Colors.RESET} - {result['error']}")
             failed += 1
 
+    # Play one clip at a time so ffplay instances don't overlap
+    if play:
+        for result in results:
+            if result["success"]:
+                await play_audio(result["audio_data"])
+
     print(f"\n{Colors.BOLD}TTS Results: {passed} passed, {failed} failed{Colors.RESET}")
     return passed, failed
 
 
-async def run_stt_tests(client: genai.Client):
-    """Run STT tests using TTS-generated audio."""
+async def run_stt_tests(client: genai.Client, audio_verify: bool = False,
+                        record: bool = False, tts_audio: Optional[dict] = None):
+    """Run STT tests using TTS-generated audio.
+
+    With audio_verify, each clip is also compared against its reference clip;
+    with record, each clip is saved as the new reference instead.
+    tts_audio holds audio already generated by prefetch_tts.
+    """
     print_header("STT (Speech-to-Text) Tests")
 
     # We need audio to test STT - generate it from TTS first
@@ -276,17 +581,31 @@ async def run_stt_tests(client: genai.Client):
     passed = 0
     failed = 0
 
-    test_phrases = [
-        "Move forward",
-        "Turn left 90 degrees",
-        "What do you see",
-    ]
+    # Run the TTS -> STT round trips concurrently, so one phrase's
+    # transcription overlaps the next phrase's speech generation
+    semaphore = asyncio.Semaphore(ROUND_TRIP_CONCURRENCY)
 
-    for phrase in test_phrases:
+    async def round_trip(phrase: str):
+        async with semaphore:
+            tts_result = await cached_tts(client, phrase, tts_audio)
+        if not tts_result["success"]:
+            return tts_result, None
+        async with semaphore:
+            # Transcribe it back (TTS outputs raw PCM)
+            stt_result = await test_stt(client, tts_result["audio_data"], expected_text=phrase, is_raw_pcm=True)
+        return tts_result, stt_result
+
+    results = await asyncio.gather(*(round_trip(phrase) for phrase in STT_TEST_PHRASES), return_exceptions=True)
+
+    for phrase, result in zip(STT_TEST_PHRASES, results):
         print(f"\n{Colors.CYAN}Testing round-trip:{Colors.RESET} \"{phrase}\"")
 
-        # Generate TTS audio
-        tts_result = await test_tts(client, phrase, play=False)
+        if isinstance(result, Exception):
+            print(f"  {Colors.RED}FAIL{Colors.RESET} - {result}")
+            failed += 1
+            continue
+
+        tts_result, stt_result = result
         if not tts_result["success"]:
             print(f"  {Colors.RED}FAIL{Colors.RESET} - Could not generate audio: {tts_result['error']}")
             failed += 1
@@ -294,8 +613,15 @@ async def run_stt_tests(client: genai.Client):
 
         print(f"  {Colors.DIM}Generated {tts_result['audio_size']:,} bytes{Colors.RESET}")
 
-        # Transcribe it back (TTS outputs raw PCM)
-        stt_result = await test_stt(client, tts_result["audio_data"], expected_text=phrase, is_raw_pcm=True)
+        # Scored on the main thread: numba's TBB pool hangs at exit if a
+        # parallel kernel was first launched from a worker thread
+        if record:
+            record_reference(phrase, tts_result["audio_data"])
+            print(f"  {Colors.DIM}Saved as audio reference{Colors.RESET}")
+        elif audio_verify:
+            match = verify_audio(phrase, tts_result["audio_data"])
+            color = Colors.GREEN if match >= AUDIO_VERIFY_THRESHOLD else Colors.YELLOW
+            print(f"  {color}Audio match{Colors.RESET} - {match:.2f} against reference")
 
         if stt_result["success"]:
             transcribed = stt_result["transcription"]
@@ -317,19 +643,28 @@ async def run_stt_tests(client: genai.Client):
     return passed, failed
 
 
-async def run_integration_test(client: genai.Client):
-    """Run a full integration test simulating the voice pipeline."""
+async def run_integration_test(client: genai.Client, tts_audio: Optional[dict] = None):
+    """Run a full integration test simulating the voice pipeline.
+
+    tts_audio holds audio already generated by prefetch_tts.
+    """
     print_header("Integration Test (Full Pipeline)")
 
     print(f"\n{Colors.CYAN}Simulating: User says 'move forward' -> Robot responds{Colors.RESET}")
 
+    # The robot's reply doesn't depend on the transcription, so generate it
+    # in the background while steps 1 and 2 run
+    robot_response = INTEGRATION_ROBOT_RESPONSE
+    response_task = asyncio.create_task(cached_tts(client, robot_response, tts_audio))
+
     # Step 1: Simulate user speech (we'll use TTS to generate "user" audio)
-    user_phrase = "move forward slowly"
+    user_phrase = INTEGRATION_USER_PHRASE
     print(f"\n  1. Generating 'user' audio for: \"{user_phrase}\"")
 
-    tts_result = await test_tts(client, user_phrase)
+    tts_result = await cached_tts(client, user_phrase, tts_audio)
     if not tts_result["success"]:
         print(f"     {Colors.RED}FAIL{Colors.RESET} - Could not generate user audio")
+        response_task.cancel()
         return 0, 1
 
     print(f"     {Colors.GREEN}OK{Colors.RESET} - {tts_result['audio_size']:,} bytes")
@@ -339,15 +674,15 @@ async def run_integration_test(client: genai.Client):
     stt_result = await test_stt(client, tts_result["audio_data"], is_raw_pcm=True)
     if not stt_result["success"]:
         print(f"     {Colors.RED}FAIL{Colors.RESET} - STT failed")
+        response_task.cancel()
         return 0, 1
 
     print(f"     {Colors.GREEN}OK{Colors.RESET} - Heard: \"{stt_result['transcription']}\"")
 
     # Step 3: Generate robot response TTS
-    robot_response = "Moving forward at slow speed."
     print(f"\n  3. Generating robot response: \"{robot_response}\"")
 
-    response_tts = await test_tts(client, robot_response)
+    response_tts = await response_task
     if not response_tts["success"]:
         print(f"     {Colors.RED}FAIL{Colors.RESET} - Could not generate response audio")
         return 0, 1
@@ -364,8 +699,31 @@ async def main():
     parser.add_argument("--stt-only", action="store_true", help="Run STT tests only")
     parser.add_argument("--play", action="store_true", help="Play generated audio")
     parser.add_argument("--integration", action="store_true", help="Run integration test only")
+    parser.add_argument("--no-cache", action="store_true", help="Always call the API for TTS audio")
+    parser.add_argument("--audio-verify", action="store_true",
+                        help="Compare round-trip TTS audio against the checked-in reference clips (implies --no-cache)")
+    parser.add_argument("--record-reference", action="store_true",
+                        help=f"Save fresh round-trip TTS audio as the reference clips in {TTS_REFERENCE_DIR.name}/")
+    parser.add_argument("--batch", action="store_true",
+                        help="Generate the TTS test phrases through the Batch API (half price, slower)")
     args = parser.parse_args()
 
+    if args.audio_verify and not NUMPY_AVAILABLE:
+        print(f"{Colors.RED}Error: --audio-verify requires numpy{Colors.RESET}")
+        return
+
+    if args.audio_verify and not args.record_reference:
+        missing = missing_references(STT_TEST_PHRASES)
+        if missing:
+            print(f"{Colors.RED}Error: --audio-verify needs a reference clip for every round-trip phrase{Colors.RESET}")
+            print(f"Missing in {TTS_REFERENCE_DIR / TTS_VOICE}: {', '.join(repr(p) for p in missing)}")
+            print("Record them first with --record-reference, listen to them, and commit them")
+            return
+
+    # Audio verification and recording need freshly generated clips, not cached ones
+    global TTS_CACHE_ENABLED
+    TTS_CACHE_ENABLED = not (args.no_cache or args.audio_verify or args.record_reference)
+
     # Check API key (support both names)
     api_key = os.getenv("GOOGLE_API_KEY") or os.getenv("GEMINI_API_KEY")
     if not api_key:
@@ -376,37 +734,50 @@ async def main():
     print(f"{Colors.BOLD}Gemini TTS/STT Test Suite{Colors.RESET}")
     print(f"{Colors.DIM}Using models: STT={STT_MODEL}, TTS={TTS_MODEL}, Voice={TTS_VOICE}{Colors.RESET}")
 
-    # Initialize client
-    client = genai.Client(api_key=api_key)
+    # One client for the whole suite, so concurrent requests share its connection pool
+    client = genai.Client(api_key=api_key, http_options=types.HttpOptions(timeout=API_TIMEOUT_MS))
 
     total_passed = 0
     total_failed = 0
 
-    if args.integration:
-        p, f = await run_integration_test(client)
-        total_passed += p
-        total_failed += f
-    elif args.tts_only:
-        p, f = await run_tts_tests(client, play=args.play)
-        total_passed += p
-        total_failed += f
-    elif args.stt_only:
-        p, f = await run_stt_tests(client)
-        total_passed += p
-        total_failed += f
-    else:
-        # Run all tests
-        p, f = await run_tts_tests(client, play=args.play)
-        total_passed += p
-        total_failed += f
-
-        p, f = await run_stt_tests(client)
-        total_passed += p
-        total_failed += f
-
-        p, f = await run_integration_test(client)
-        total_passed += p
-        total_failed += f
+    try:
+        if args.integration:
+            p, f = await run_integration_test(client)
+            total_passed += p
+            total_failed += f
+        elif args.tts_only:
+            p, f = await run_tts_tests(client, play=args.play, batch=args.batch)
+            total_passed += p
+            total_failed += f
+        elif args.stt_only:
+            p, f = await run_stt_tests(client, audio_verify=args.audio_verify,
+                                       record=args.record_reference)
+            total_passed += p
+            total_failed += f
+        else:
+            # Run all tests, generating every distinct phrase's audio in one concurrent wave
+            phrases = [*STT_TEST_PHRASES, INTEGRATION_USER_PHRASE, INTEGRATION_ROBOT_RESPONSE]
+            if not args.batch:
+                phrases += TTS_TEST_PHRASES
+            tts_audio = await prefetch_tts(client, phrases)
+
+            p, f = await run_tts_tests(client, play=args.play, batch=args.batch, tts_audio=tts_audio)
+            total_passed += p
+            total_failed += f
+
+            p, f = await run_stt_tests(client, audio_verify=args.audio_verify,
+                                       record=args.record_reference, tts_audio=tts_audio)
+            total_passed += p
+            total_failed += f
+
+            p, f = await run_integration_test(client, tts_audio=tts_audio)
+            total_passed += p
+            total_failed += f
+    finally:
+        # Release pooled connections (AsyncClient.aclose only exists in newer SDK releases)
+        aclose = getattr(client.aio, "aclose", None)
+        if aclose:
+            await aclose()
 
     # Final summary
     print_header("Final Results")
@@ -0,0 +1,165 @@
+"""Vision cache - reuse sense() answers while the camera view is unchanged.
+
+Frames are keyed by a 64-bit perceptual hash (pHash), so small sensor noise
+between consecutive JPEGs still counts as the same scene.
+"""
+
+import io
+import time
+from collections import OrderedDict
+from typing import Optional
+
+try:
+    import numpy as np
+    from PIL import Image
+    PHASH_AVAILABLE = True
+except ImportError:
+    PHASH_AVAILABLE = False
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Cache tuning
+VISION_CACHE_SIZE = 64  # Entries kept (LRU)
+VISION_CACHE_MAX_AGE = 2.0  # Seconds before an answer is considered stale
+VISION_CACHE_MAX_DISTANCE = 5  # Max differing pHash bits to count as the same scene
+
+# Frames uploaded to the vision model
+VISION_IMAGE_SHORT_SIDE = 512  # px - larger frames are downscaled to this short side
+VISION_IMAGE_QUALITY = 75  # WebP quality
+
+PHASH_SIZE = 32  # Grayscale downsample size
+PHASH_BLOCK = 8  # Low-frequency DCT block used for the hash
+
+
+def _dct_matrix(n: int):
+    """Orthonormal DCT-II basis matrix (n x n)."""
+    k = np.arange(n)[:, None]
+    i = np.arange(n)[None, :]
+    matrix = np.sqrt(2.0 / n) * np.cos(np.pi * (2 * i + 1) * k / (2 * n))
+    matrix[0] /= np.sqrt(2.0)
+    return matrix.astype(np.float32)
+
+
+# Only the low-frequency rows of the basis are needed for the hash
+_DCT = _dct_matrix(PHASH_SIZE)[:PHASH_BLOCK] if PHASH_AVAILABLE else None
+
+
+def _phash64(gray, dct):
+    """Hash a PHASH_SIZE^2 grayscale array: 8x8 low-freq DCT block vs its median."""
+    n = gray.shape[0]
+    rows = np.zeros((PHASH_BLOCK, n), dtype=np.float32)
+    for u in range(PHASH_BLOCK):
+        for i in range(n):
+            coeff = dct[u, i]
+            for j in range(n):
+                rows[u, j] += coeff * gray[i, j]
+
+    block = np.zeros(PHASH_BLOCK * PHASH_BLOCK, dtype=np.float32)
+    for u in range(PHASH_BLOCK):
+        for v in range(PHASH_BLOCK):
+            acc = np.float32(0.0)
+            for j in range(n):
+                acc += rows[u, j] * dct[v, j]
+            block[u * PHASH_BLOCK + v] = acc
+
+    median = np.median(block)
+    result = np.uint64(0)
+    for k in range(PHASH_BLOCK * PHASH_BLOCK):
+        result = (result << np.uint64(1)) | np.uint64(block[k] > median)
+    return result
+
+
+if NUMBA_AVAILABLE and PHASH_AVAILABLE:
+    _phash64 = njit(cache=True, fastmath=True)(_phash64)
+
+
+def warm_up_phash():
+    """Compile the JIT pHash kernel ahead of the first frame (no-op without numba)."""
+    if NUMBA_AVAILABLE and PHASH_AVAILABLE:
+        _phash64(np.zeros((PHASH_SIZE, PHASH_SIZE), dtype=np.float32), _DCT)
+
+
+def frame_phash(frame: bytes) -> Optional[int]:
+    """Compute a 64-bit perceptual hash of a JPEG frame.
+
+    Returns:
+        The hash as an int, or None if Pillow/numpy are missing or the frame
+        can't be decoded.
+    """
+    if not PHASH_AVAILABLE:
+        return None
+    try:
+        image = Image.open(io.BytesIO(frame))
+        image.draft("L", (PHASH_SIZE * 2, PHASH_SIZE * 2))  # Let libjpeg downscale while decoding
+        image = image.convert("L").resize((PHASH_SIZE, PHASH_SIZE), Image.BILINEAR)
+    except Exception:
+        return None
+
+    pixels = np.asarray(image, dtype=np.float32)
+    if NUMBA_AVAILABLE:
+        return int(_phash64(pixels, _DCT))
+    block = _DCT @ pixels @ _DCT.T
+    bits = (block > np.median(block)).flatten()
+    return int.from_bytes(np.packbits(bits).tobytes(), "big")
+
+
+def encode_for_vision(frame: bytes) -> tuple[bytes, str]:
+    """Downscale a JPEG frame and re-encode it as WebP for a smaller vision upload.
+
+    Returns:
+        (image bytes, mime type) - the original JPEG if Pillow (or its WebP
+        support) is missing or the frame can't be decoded.
+    """
+    if not PHASH_AVAILABLE:
+        return frame, "image/jpeg"
+    try:
+        image = Image.open(io.BytesIO(frame))
+        scale = VISION_IMAGE_SHORT_SIDE / min(image.size)
+        if scale < 1:
+            size = (round(image.width * scale), round(image.height * scale))
+            image.draft("RGB", size)  # Let libjpeg downscale while decoding
+            image = image.convert("RGB").resize(size, Image.LANCZOS)
+        buffer = io.BytesIO()
+        image.save(buffer, "WEBP", quality=VISION_IMAGE_QUALITY)
+    except Exception:
+        return frame, "image/jpeg"
+    return buffer.getvalue(), "image/webp"
+
+
+class VisionCache:
+    """LRU of vision answers keyed by (frame pHash, normalized question)."""
+
+    def __init__(self, size: int = VISION_CACHE_SIZE, max_age: float = VISION_CACHE_MAX_AGE,
+                 max_distance: int = VISION_CACHE_MAX_DISTANCE):
+        self.size = size
+        self.max_age = max_age
+        self.max_distance = max_distance
+        self._entries: OrderedDict[tuple[int, str], tuple[str, float]] = OrderedDict()
+
+    @staticmethod
+    def normalize(question: Optional[str]) -> str:
+        return (question or "").lower().strip()
+
+    def get(self, phash: int, question: Optional[str]) -> Optional[str]:
+        """Return a fresh cached answer for a near-identical frame, or None."""
+        question_key = self.normalize(question)
+        now = time.monotonic()
+        for key, (answer, stored_at) in self._entries.items():
+            cached_hash, cached_question = key
+            if cached_question != question_key or now - stored_at > self.max_age:
+                continue
+            if bin(cached_hash ^ phash).count("1") <= self.max_distance:
+                self._entries.move_to_end(key)
+                return answer
+        return None
+
+    def put(self, phash: int, question: Optional[str], answer: str):
+        key = (phash, self.normalize(question))
+        self._entries[key] = (answer, time.monotonic())
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.size:
+            self._entries.popitem(last=False)
@@ -7,6 +7,15 @@ import { Mic, MicOff, Bot } from 'lucide-react'
 
 const MAX_RECONNECT_DELAY = 10000 // 10 seconds max
 const INITIAL_RECONNECT_DELAY = 1000 // 1 second
+const TTS_SAMPLE_RATE = 24000 // Gemini TTS: 24kHz mono 16-bit PCM
+const TTS_CHANNELS = 1
+
+// Agent activity streamed by /ws/ai as 'agent_events' frames (AgentEvent.to_dict on the backend)
+interface AgentEvent {
+  type: 'env' | 'prompt' | 'thinking' | 'tool_call' | 'tool_result' | 'response' | 'error'
+  data: unknown
+  details: Record<string, unknown>
+}
 
 export function AIChat() {
   const { connected, mode, aiState, aiTranscript, setAiState, addAiMessage } = useRobotStore()
@@ -17,20 +26,45 @@ export function AIChat() {
   const reconnectTimeoutRef = useRef<ReturnType<typeof setTimeout> | null>(null)
   const reconnectDelayRef = useRef(INITIAL_RECONNECT_DELAY)
   const [error, setError] = useState<string | null>(null)
+  const [activity, setActivity] = useState<string | null>(null)
 
   const isAIMode = mode === 3
 
-  const playAudio = useCallback(async (base64Data: string) => {
-    try {
-      // TTS returns WAV audio
-      const response = await fetch(`data:audio/wav;base64,${base64Data}`)
-      const blob = await response.blob()
-      const url = URL.createObjectURL(blob)
-      const audio = new Audio(url)
-      audio.onended = () => URL.revokeObjectURL(url)
-      await audio.play()
-    } catch (e) {
-      console.error('Failed to play audio:', e)
+  // TTS is streamed as raw 16-bit PCM chunks - schedule them back-to-back on one AudioContext
+  const audioContextRef = useRef<AudioContext | null>(null)
+  const nextStartTimeRef = useRef(0)
+
+  const playAudio = useCallback((pcmData: ArrayBuffer) => {
+    if (!audioContextRef.current) {
+      audioContextRef.current = new AudioContext()
+    }
+    const ctx = audioContextRef.current
+    if (ctx.state === 'suspended') {
+      ctx.resume().catch((e) => console.error('Failed to resume audio:', e))
+    }
+
+    const samples = new Int16Array(pcmData)
+    if (samples.length === 0) return
+    const buffer = ctx.createBuffer(TTS_CHANNELS, samples.length, TTS_SAMPLE_RATE)
+    const channel = buffer.getChannelData(0)
+    for (let i = 0; i < samples.length; i++) {
+      channel[i] = samples[i] / 32768
+    }
+
+    const source = ctx.createBufferSource()
+    source.buffer = buffer
+    source.connect(ctx.destination)
+    // Start right after the previous chunk (or now, if playback has drained)
+    const startTime = Math.max(nextStartTimeRef.current, ctx.currentTime)
+    source.start(startTime)
+    nextStartTimeRef.current = startTime + buffer.duration
+  }, [])
+
+  useEffect(() => {
+    return () => {
+      audioContextRef.current?.close()
+      audioContextRef.current = null
+      nextStartTimeRef.current = 0
     }
   }, [])
 
@@ -41,6 +75,7 @@ export function AIChat() {
     if (wsRef.current?.readyState === WebSocket.OPEN) return
 
     const ws = new WebSocket(`ws://${window.location.host}/ws/ai`)
+    ws.binaryType = 'arraybuffer'
     wsRef.current = ws
 
     ws.onopen = () => {
@@ -49,15 +84,26 @@ export function AIChat() {
     }
 
     ws.onmessage = (event) => {
+      // Binary frames are TTS audio (raw 16-bit PCM)
+      if (event.data instanceof ArrayBuffer) {
+        playAudio(event.data)
+        return
+      }
+
       try {
         const data = JSON.parse(event.data)
         if (data.type === 'state') {
           setAiState(data.state)
+          if (data.state === 'idle') setActivity(null)
+        } else if (data.type === 'agent_events') {
+          // Show the latest tool the agent is running while it thinks
+          const calls = (data.events as AgentEvent[]).filter((e) => e.type === 'tool_call')
+          const last = calls[calls.length - 1]
+          if (last) {
+            setActivity(`${last.data}(${JSON.stringify(last.details.args ?? {})})`)
+          }
         } else if (data.type === 'transcript') {
           addAiMessage(data.role, data.text)
-        } else if (data.type === 'audio') {
-          // Play TTS audio
-          playAudio(data.data)
         } else if (data.type === 'error') {
           setError(data.message)
         }
@@ -73,6 +119,7 @@ export function AIChat() {
     ws.onclose = () => {
       wsRef.current = null
       setAiState('idle')
+      setActivity(null)
       // Only reconnect if still in AI mode and connected
       const state = useRobotStore.getState()
       if (state.connected && state.mode === 3) {
@@ -138,6 +185,12 @@ export function AIChat() {
       return
     }
 
+    // Unlock TTS playback inside the user gesture (browser autoplay policy)
+    if (!audioContextRef.current) {
+      audioContextRef.current = new AudioContext()
+    }
+    audioContextRef.current.resume().catch(() => {})
+
     try {
       const stream = await navigator.mediaDevices.getUserMedia({ audio: true })
       const recorder = new MediaRecorder(stream, { mimeType: 'audio/webm' })
@@ -150,15 +203,12 @@ export function AIChat() {
         }
       }
 
-      recorder.onstop = async () => {
+      recorder.onstop = () => {
         const blob = new Blob(chunksRef.current, { type: 'audio/webm' })
-        const base64 = await blobToBase64(blob)
 
+        // Send recorded audio as a binary frame
         if (wsRef.current?.readyState === WebSocket.OPEN) {
-          wsRef.current.send(JSON.stringify({
-            type: 'audio',
-            data: base64,
-          }))
+          wsRef.current.send(blob)
         }
 
         // Stop all tracks
@@ -182,18 +232,6 @@ export function AIChat() {
     }
   }
 
-  const blobToBase64 = (blob: Blob): Promise<string> => {
-    return new Promise((resolve, reject) => {
-      const reader = new FileReader()
-      reader.onloadend = () => {
-        const base64 = (reader.result as string).split(',')[1]
-        resolve(base64)
-      }
-      reader.onerror = reject
-      reader.readAsDataURL(blob)
-    })
-  }
-
   return (
     <Card className="flex-1 flex flex-col">
       <CardHeader className="pb-2">
@@ -247,6 +285,12 @@ export function AIChat() {
           )}
         </div>
 
+        {activity && (
+          <p className="text-xs text-muted-foreground font-mono truncate">
+            Running: {activity}
+          </p>
+        )}
+
         {error && <p className="text-sm text-destructive">{error}</p>}
 
         <Button
@@ -1,9 +1,17 @@
 import { useEffect, useRef, useCallback } from 'react'
 import { useRobotStore } from '@/stores/robotStore'
+import { decodeMsgpack } from '@/lib/msgpack'
 
 const MAX_RECONNECT_DELAY = 10000 // 10 seconds max
 const INITIAL_RECONNECT_DELAY = 1000 // 1 second
 
+interface SensorMessage {
+  type: string
+  value?: number | string | null
+  ultrasonic?: number | null
+  gripper?: string | null
+}
+
 export function useSensors() {
   const wsRef = useRef<WebSocket | null>(null)
   const reconnectTimeoutRef = useRef<ReturnType<typeof setTimeout> | null>(null)
@@ -17,6 +25,7 @@ export function useSensors() {
     if (wsRef.current?.readyState === WebSocket.OPEN) return
 
     const ws = new WebSocket(`ws://${window.location.host}/ws/sensors`)
+    ws.binaryType = 'arraybuffer'
     wsRef.current = ws
 
     ws.onopen = () => {
@@ -26,16 +35,19 @@ export function useSensors() {
 
     ws.onmessage = (event) => {
       try {
-        const data = JSON.parse(event.data)
+        // Binary frames are MessagePack; text frames are JSON (backend without msgpack)
+        const data = (event.data instanceof ArrayBuffer
+          ? decodeMsgpack(event.data)
+          : JSON.parse(event.data)) as SensorMessage
         if (data.type === 'ultrasonic') {
-          setUltrasonicDistance(data.value)
+          setUltrasonicDistance(data.value as number | null)
         } else if (data.type === 'gripper') {
-          setGripperStatus(data.value)
+          setGripperStatus(data.value as string | null)
         } else if (data.type === 'initial') {
-          if (data.ultrasonic !== null) {
+          if (data.ultrasonic != null) {
             setUltrasonicDistance(data.ultrasonic)
           }
-          if (data.gripper !== null) {
+          if (data.gripper != null) {
             setGripperStatus(data.gripper)
           }
         }
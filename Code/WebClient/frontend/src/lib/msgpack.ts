@@ -0,0 +1,71 @@
+// Minimal MessagePack decoder for the backend's binary sensor frames.
+// Covers nil, booleans, ints, floats, strings, arrays and maps (no bin/ext types).
+
+export function decodeMsgpack(buffer: ArrayBuffer): unknown {
+  const bytes = new Uint8Array(buffer)
+  const view = new DataView(buffer)
+  const text = new TextDecoder()
+  let offset = 0
+
+  // Advance past n bytes and return where they start
+  function take(n: number) {
+    const start = offset
+    offset += n
+    return start
+  }
+
+  function str(length: number) {
+    const start = take(length)
+    return text.decode(bytes.subarray(start, start + length))
+  }
+
+  function array(size: number) {
+    const result: unknown[] = []
+    for (let i = 0; i < size; i++) result.push(read())
+    return result
+  }
+
+  function map(size: number) {
+    const result: Record<string, unknown> = {}
+    for (let i = 0; i < size; i++) {
+      const key = String(read())
+      result[key] = read()
+    }
+    return result
+  }
+
+  function read(): unknown {
+    const byte = bytes[take(1)]
+    if (byte <= 0x7f) return byte
+    if (byte >= 0xe0) return byte - 0x100
+    if ((byte & 0xf0) === 0x80) return map(byte & 0x0f)
+    if ((byte & 0xf0) === 0x90) return array(byte & 0x0f)
+    if ((byte & 0xe0) === 0xa0) return str(byte & 0x1f)
+
+    switch (byte) {
+      case 0xc0: return null
+      case 0xc2: return false
+      case 0xc3: return true
+      case 0xca: return view.getFloat32(take(4))
+      case 0xcb: return view.getFloat64(take(8))
+      case 0xcc: return view.getUint8(take(1))
+      case 0xcd: return view.getUint16(take(2))
+      case 0xce: return view.getUint32(take(4))
+      case 0xcf: return Number(view.getBigUint64(take(8)))
+      case 0xd0: return view.getInt8(take(1))
+      case 0xd1: return view.getInt16(take(2))
+      case 0xd2: return view.getInt32(take(4))
+      case 0xd3: return Number(view.getBigInt64(take(8)))
+      case 0xd9: return str(view.getUint8(take(1)))
+      case 0xda: return str(view.getUint16(take(2)))
+      case 0xdb: return str(view.getUint32(take(4)))
+      case 0xdc: return array(view.getUint16(take(2)))
+      case 0xdd: return array(view.getUint32(take(4)))
+      case 0xde: return map(view.getUint16(take(2)))
+      case 0xdf: return map(view.getUint32(take(4)))
+      default: throw new Error(`Unsupported MessagePack type 0x${byte.toString(16)}`)
+    }
+  }
+
+  return read()
+}